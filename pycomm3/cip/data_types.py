@@ -24,9 +24,10 @@
 
 import reprlib
 import ipaddress
+from functools import lru_cache
 from io import BytesIO
-from itertools import chain
-from struct import pack, unpack
+from itertools import chain, islice
+from struct import Struct as _Struct
 from typing import Any, Sequence, Optional, Tuple, Dict, Union, List, Type
 
 from ..exceptions import DataError, BufferEmptyError
@@ -210,15 +211,21 @@ class ElementaryDataType(DataType):
     code: int = 0x00  #: CIP data type identifier
     size: int = 0  #: size of type in bytes
     _format: str = ""
+    _struct: Optional[_Struct] = None  # precompiled from ``_format`` when the subclass is created
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._format:
+            cls._struct = _Struct(cls._format)
 
     @classmethod
     def _encode(cls, value: Any) -> bytes:
-        return pack(cls._format, value)
+        return cls._struct.pack(value)
 
     @classmethod
     def _decode(cls, stream: BytesIO) -> Any:
         data = cls._stream_read(stream, cls.size)
-        return unpack(cls._format, data)[0]
+        return cls._struct.unpack(data)[0]
 
 
 class BOOL(ElementaryDataType):
@@ -450,6 +457,10 @@ def n_bytes(count: int, name: str = ""):
     return BYTES(name)
 
 
+# bools for each bit of a byte value, least significant bit first
+_BYTE_BITS = tuple(tuple(bool(byte & (1 << bit)) for bit in range(8)) for byte in range(256))
+
+
 class BitArrayType(ElementaryDataType):
     """
     Array of bits (Python bools) for ``host_type`` integer value
@@ -459,11 +470,11 @@ class BitArrayType(ElementaryDataType):
 
     @classmethod
     def _decode(cls, stream: BytesIO) -> Any:
-        val = cls.host_type.decode(stream)
-        bits = [x == "1" for x in bin(val)[2:]]
-        bools = [False for _ in range((cls.size * 8) - len(bits))] + bits
-        bools.reverse()
-        return bools
+        data = cls._stream_read(stream, cls.size)
+        if len(data) != cls.size:
+            raise DataError(f"Not enough data to decode {cls.__name__}")
+        # host types are little-endian, so the bits of each byte in order are the bits of the value in order
+        return list(chain.from_iterable(_BYTE_BITS[byte] for byte in data))
 
     @classmethod
     def _encode(cls, value: Any) -> bytes:
@@ -759,6 +770,32 @@ class DerivedDataType(DataType):
     ...
 
 
+@lru_cache(maxsize=256)
+def _array_struct(fmt: str, count: int) -> _Struct:
+    """
+    Compiles a ``Struct`` that packs/unpacks ``count`` consecutive elements of ``fmt``
+    """
+    return _Struct(f"{fmt[0]}{count}{fmt[1:]}")
+
+
+def _packed_array_struct(
+    element_type: Union[DataType, Type[DataType]], count: int
+) -> Optional[_Struct]:
+    """
+    Returns a ``Struct`` for a contiguous array of ``count`` elements if ``element_type`` is a plain
+    fixed-size elementary type, else None.  Types that customize ``_encode``/``_decode`` are excluded.
+    """
+    _type = element_type if isinstance(element_type, type) else type(element_type)
+    if (
+        issubclass(_type, ElementaryDataType)
+        and _type._struct is not None
+        and _type._encode.__func__ is ElementaryDataType._encode.__func__
+        and _type._decode.__func__ is ElementaryDataType._decode.__func__
+    ):
+        return _array_struct(_type._format, count)
+    return None
+
+
 class _ArrayReprMeta(_DataTypeMeta):
     def __repr__(cls: "ArrayType"):
         return f"{cls.element_type}[{cls.length!r}]"
@@ -813,14 +850,46 @@ def Array(
                         for i in range(0, len(values), chunk_size)
                     ]
 
+                _struct = _packed_array_struct(cls.element_type, _len)
+                if _struct is not None:
+                    return _struct.pack(*islice(values, _len))
+
                 return b"".join(cls.element_type.encode(values[i]) for i in range(_len))
             except Exception as err:
                 raise DataError(
                     f"Error packing {reprlib.repr(values)} into {cls.element_type}[{_length}]"
                 ) from err
 
+        @classmethod
+        def _decode_packed(cls, stream, count: Optional[int] = None):
+            """
+            Decodes ``count`` elements (or the rest of the stream) with a single ``Struct`` call,
+            returns None if the element type is not a plain elementary type.
+            """
+            _type = cls.element_type if isinstance(cls.element_type, type) else type(cls.element_type)
+            if _packed_array_struct(_type, 1) is None:
+                return None
+
+            data = stream.read() if count is None else stream.read(_type.size * count)
+            _count, remainder = divmod(len(data), _type.size)
+            if remainder or (count is not None and _count != count):
+                # incomplete data, decode element by element so the usual errors are raised
+                _stream = BytesIO(data)
+                if count is None:
+                    return cls._decode_all_elements(_stream)
+                return [cls.element_type.decode(_stream) for _ in range(count)]
+
+            return list(_packed_array_struct(_type, _count).unpack(data))
+
         @classmethod
         def _decode_all(cls, stream):
+            _array = cls._decode_packed(stream)
+            if _array is None:
+                _array = cls._decode_all_elements(stream)
+            return _array
+
+        @classmethod
+        def _decode_all_elements(cls, stream):
             _array = []
             while True:
                 try:
@@ -842,7 +911,9 @@ def Array(
                 else:
                     _len = _length
 
-                _val = [cls.element_type.decode(stream) for _ in range(_length)]
+                _val = cls._decode_packed(stream, _len)
+                if _val is None:
+                    _val = [cls.element_type.decode(stream) for _ in range(_len)]
 
                 if issubclass(cls.element_type, BitArrayType):
                     return list(chain.from_iterable(_val))
@@ -31,6 +31,7 @@ __all__ = [
 import ipaddress
 import logging
 import socket
+import threading
 from functools import wraps
 from os import urandom
 from typing import Union, Optional, Tuple, List, Sequence, Type, Any, Dict
@@ -131,6 +132,7 @@ class CIPDriver:
 
         self._sequence: cycle = cycle(65535, start=1)
         self._sock: Optional[Socket] = None
+        self._send_lock = threading.Lock()  # only one request/reply on the connection at a time
         self._session: int = 0
         self._connection_opened: bool = False
         self._target_cid: Optional[bytes] = None
@@ -424,20 +426,27 @@ class CIPDriver:
             self.__log.exception("Error closing connection with device")
 
         try:
-            if self._sock:
-                self._sock.close()
+            self._close_socket()
         except Exception as err:
             errs.append(err)
             self.__log.exception("Error closing socket connection")
 
-        self._sock = None
-        self._target_is_connected = False
-        self._session = 0
-        self._connection_opened = False
-
         if errs:
             raise CommError(" - ".join(str(e) for e in errs))
 
+    def _close_socket(self):
+        """
+        Closes the socket w/o a forward close or unregistering the session, the connection must be reopened to be used again
+        """
+        try:
+            if self._sock:
+                self._sock.close()
+        finally:
+            self._sock = None
+            self._target_is_connected = False
+            self._session = 0
+            self._connection_opened = False
+
     def _un_register_session(self):
         """
         Un-registers the current session with the target.
@@ -522,7 +531,7 @@ class CIPDriver:
         """
 
         if connected:
-            with_forward_open(lambda _: None)(self)
+            self._ensure_connected()
 
         _kwargs = {
             "service": service,
@@ -568,19 +577,31 @@ class CIPDriver:
 
         return Tag(name, response.value, data_type, error=response.error)
 
+    def _ensure_connected(self):
+        """
+        Performs the forward open if not already connected, only creating the ``with_forward_open`` wrapper when needed
+        since this is checked by every connected message (including each request of a tag list upload)
+        """
+        if not self._target_is_connected:
+            with_forward_open(lambda _: None)(self)
+
+    def _request_kwargs(self) -> Dict[str, Any]:
+        return {
+            "target_cid": self._target_cid,
+            "session_id": self._session,
+            "context": self._cfg["context"],
+            "option": self._cfg["option"],
+            "sequence": self._sequence,
+        }
+
     def send(self, request: RequestPacket) -> ResponsePacket:
         if not request.error:
-            request_kwargs = {
-                "target_cid": self._target_cid,
-                "session_id": self._session,
-                "context": self._cfg["context"],
-                "option": self._cfg["option"],
-                "sequence": self._sequence,
-            }
-
-            self._send(request.build_request(**request_kwargs))
-            self.__log.debug(f"Sent: %r", request)
-            reply = None if request.no_response else self._receive()
+            request_kwargs = self._request_kwargs()
+
+            with self._send_lock:
+                self._send(request.build_request(**request_kwargs))
+                self.__log.debug(f"Sent: %r", request)
+                reply = None if request.no_response else self._receive()
         else:
             reply = None
 
@@ -588,6 +609,34 @@ class CIPDriver:
         self.__log.debug(f"Received: %r", response)
         return response
 
+    def _send_pipelined(self, requests: Sequence[RequestPacket]) -> List[ResponsePacket]:
+        """
+        Sends all of the ``requests`` before waiting for any replies, so the round-trips overlap
+        instead of happening one after another.  The responses are returned in the same order as the requests.
+        Only use for requests that always get a reply and don't depend on each other.
+        """
+        request_kwargs = self._request_kwargs()
+        with self._send_lock:
+            try:
+                for request in requests:
+                    self._send(request.build_request(**request_kwargs))
+                    self.__log.debug(f"Sent: %r", request)
+                replies = [self._receive() for _ in requests]
+            except Exception:
+                # any replies still outstanding would be received as the reply to the next request,
+                # closing the socket is the only way to be sure the connection doesn't get out of sync
+                self.__log.error("Pipelined requests failed, closing the connection")
+                try:
+                    self._close_socket()
+                except Exception:
+                    self.__log.exception("Error closing socket connection")
+                raise
+
+        responses = [request.response_class(request, reply) for request, reply in zip(requests, replies)]
+        for response in responses:
+            self.__log.debug(f"Received: %r", response)
+        return responses
+
     def _send(self, message):
         try:
             self.__log.verbose(">>> SEND >>> \n%s", PacketLazyFormatter(message))
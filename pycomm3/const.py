@@ -54,6 +54,16 @@ TIMEOUT_MULTIPLIER = b"\x07"
 TRANSPORT_CLASS = b"\xa3"
 BASE_TAG_BIT = 1 << 26
 
+# symbol type (symbol object attribute 2) bits
+SYMBOL_TYPE_STRUCT = 1 << 15  # bit 15, 1 = struct, 0 = atomic
+SYMBOL_TYPE_DIMS = 0b0110_0000_0000_0000  # bit 13 & 14, number of array dims
+SYMBOL_TYPE_DIMS_SHIFT = 13
+SYMBOL_TYPE_SYSTEM = 1 << 12  # bit 12, system tag
+SYMBOL_TYPE_TEMPLATE_ID = 0b0000_1111_1111_1111  # template instance id for structs
+SYMBOL_TYPE_BIT_POSITION = 0b0000_0111_0000_0000  # bit position for BOOL tags
+SYMBOL_TYPE_BIT_POSITION_SHIFT = 8
+SYMBOL_TYPE_ATOMIC = 0b0000_0000_1111_1111  # atomic data type code
+
 SEC_TO_US = 1_000_000  # seconds to microseconds
 
 TEMPLATE_MEMBER_INFO_LEN = 8  # 2B bit/array len, 2B datatype, 4B offset
@@ -68,11 +68,8 @@ def FixedSizeString(size_: int, len_type_: Union[DataType, Type[DataType]] = UDI
 
         @classmethod
         def _encode(cls, value: str, *args, **kwargs) -> bytes:
-            return (
-                cls.len_type.encode(len(value))
-                + value.encode(cls.encoding)
-                + b"\x00" * (cls.size - len(value))
-            )
+            _data = value.encode(cls.encoding)
+            return cls.len_type.encode(len(_data)) + _data.ljust(cls.size, b"\x00")
 
         @classmethod
         def _decode(cls, stream: BytesIO) -> str:
@@ -26,13 +26,17 @@ __all__ = [
     "LogixDriver",
 ]
 
+import copy
 import datetime
 import logging
 import operator
+import re
+import shelve
+import struct
 import time
 from functools import reduce
-from io import BytesIO
-from typing import List, Tuple, Optional, Union, Dict, Type, Sequence
+from itertools import islice
+from typing import List, Tuple, Optional, Union, Dict, Type, Sequence, NamedTuple
 
 from . import util
 from .cip import (
@@ -46,12 +50,9 @@ from .cip import (
     n_bytes,
     ULINT,
     DataSegment,
-    USINT,
     UINT,
     LogicalSegment,
     PADDED_EPATH,
-    UDINT,
-    DINT,
     Array,
     DataType,
     ArrayType,
@@ -59,12 +60,19 @@ from .cip import (
 )
 from .cip_driver import CIPDriver, with_forward_open, parse_connection_path
 from .const import (
-    EXTENDED_SYMBOL,
     MICRO800_PREFIX,
     MULTISERVICE_READ_OVERHEAD,
     SUCCESS,
     INSUFFICIENT_PACKETS,
     BASE_TAG_BIT,
+    SYMBOL_TYPE_STRUCT,
+    SYMBOL_TYPE_DIMS,
+    SYMBOL_TYPE_DIMS_SHIFT,
+    SYMBOL_TYPE_SYSTEM,
+    SYMBOL_TYPE_TEMPLATE_ID,
+    SYMBOL_TYPE_BIT_POSITION,
+    SYMBOL_TYPE_BIT_POSITION_SHIFT,
+    SYMBOL_TYPE_ATOMIC,
     MIN_VER_INSTANCE_IDS,
     SEC_TO_US,
     TEMPLATE_MEMBER_INFO_LEN,
@@ -88,6 +96,8 @@ from .packets import (
     WriteTagRequestPacket,
     MultiServiceRequestPacket,
     ReadModifyWriteRequestPacket,
+    GenericConnectedRequestPacket,
+    tag_request_path,
 )
 from .tag import Tag
 
@@ -95,6 +105,57 @@ AtomicValueType = Union[int, float, bool, str]
 TagValueType = Union[AtomicValueType, List[AtomicValueType], Dict[str, "TagValueType"]]
 ReadWriteReturnType = Union[Tag, List[Tag]]
 
+_REQUEST_CACHE_SIZE = 1024  # max entries kept in each of the per-tag request caches
+
+# fixed-size parts of a symbol instance in a get_instance_attribute_list reply
+_SYMBOL_INSTANCE_HEADER = struct.Struct("<IH")  # instance id, name length
+_SYMBOL_INSTANCE_ATTRS = struct.Struct("<H6I")  # type, address, object address, software control, dims
+_SYMBOL_INSTANCE_ATTRS_ACCESS = struct.Struct("<H6IB")  # same as above + external access
+_TEMPLATE_MEMBER_INFO = struct.Struct("<HHI")  # bit/array len, data type, offset (TEMPLATE_MEMBER_INFO_LEN bytes)
+
+_STRUCTURE_MAKEUP_ATTRS = b"".join(
+    (
+        b"\x04\x00",  # Number of attributes
+        b"\x04\x00",  # Template Object Definition Size UDINT
+        b"\x05\x00",  # Template Structure Size UDINT
+        b"\x02\x00",  # Template Member Count UINT
+        b"\x01\x00",  # Structure Handle We can use this to read and write UINT
+    )
+)
+_STRUCTURE_MAKEUP_REPLY_SIZE = 36  # reply header + StructTemplateAttributes + multi-service offset
+
+_SYMBOL_ATTRS = (
+    b"\x01\x00",  # Attr. 1: Symbol name
+    b"\x02\x00",  # Attr. 2 : Symbol Type
+    b"\x03\x00",  # Attr. 3 : Symbol Address
+    b"\x05\x00",  # Attr. 5 : Symbol Object Address
+    b"\x06\x00",  # Attr. 6 : ? - Not documented (Software Control?)
+    b"\x08\x00",  # Attr. 8 : array dimensions [1,2,3]
+)
+_SYMBOL_ATTRS_ACCESS = (*_SYMBOL_ATTRS, b"\x0a\x00")  # Attr. 10 : external access
+# attribute count + attribute list for get_instance_attribute_list requests
+_SYMBOL_ATTRS_REQUEST = b"".join((UINT.encode(len(_SYMBOL_ATTRS)), *_SYMBOL_ATTRS))
+_SYMBOL_ATTRS_ACCESS_REQUEST = b"".join((UINT.encode(len(_SYMBOL_ATTRS_ACCESS)), *_SYMBOL_ATTRS_ACCESS))
+
+_READ_TEMPLATE_REQUEST = struct.Struct("<iH")  # offset DINT, bytes to read UINT
+
+_IO_TAG_PATTERN = re.compile(":[IOCS]")  # I/O module tags, e.g. Local:1:I or Module:C
+
+
+class _SymbolInstance(NamedTuple):
+    """
+    Raw symbol object instance attributes from the tag list upload, before isolating the user tags
+    """
+
+    instance_id: int
+    tag_name: str
+    symbol_type: int
+    symbol_address: int
+    symbol_object_address: int
+    software_control: int
+    external_access: str
+    dimensions: List[int]
+
 
 class LogixDriver(CIPDriver):
     """
@@ -110,6 +171,8 @@ class LogixDriver(CIPDriver):
         *args,
         init_tags: bool = True,
         init_program_tags: bool = True,
+        template_cache_path: Optional[str] = None,
+        template_read_depth: int = 1,
         **kwargs,
     ):
         """
@@ -130,6 +193,13 @@ class LogixDriver(CIPDriver):
         :param init_tags: if True (default), uploads all controller-scoped tag definitions on connect
         :param init_program_tags: if False, bypasses uploading program-scoped tags. set to False if there are a lot of program tags and you aren't
                 using any of them to decrease tag upload times.
+        :param template_cache_path: path of a file (opened with :mod:`shelve`) to cache the UDT template definitions
+                read during the tag list upload. Templates are stored per controller serial number and only
+                reused if the structure handle, size, and member count still match, so subsequent uploads
+                only need to read the templates that have changed.
+        :param template_read_depth: number of template fragment requests to send before waiting for the replies
+                when reading large UDT templates, values > 1 hide the round-trip latency but require the controller
+                to accept multiple outstanding requests on the connection.  Default of 1 waits for each reply.
 
         .. tip::
 
@@ -146,6 +216,13 @@ class LogixDriver(CIPDriver):
         self._tags = {}
         self._micro800 = False
         self._cfg["use_instance_ids"] = True
+        self._cfg["template_read_depth"] = max(1, template_read_depth)
+        self._request_cache_tags = None  # tag definitions the request caches were built from
+        self._request_path_cache = {}
+        self._parsed_tag_cache = {}
+        self._read_request_cache = {}
+        self._template_cache_path = template_cache_path
+        self._template_store = None
         self._init_args = {
             "init_tags": init_tags,
             "init_program_tags": init_program_tags,
@@ -418,12 +495,16 @@ class LogixDriver(CIPDriver):
             self._info["modules"] = {}
 
         self.__log.info("Starting tag list upload...")
-        if program == "*":
-            tags = self._get_tag_list()
-            for prog in self._info["programs"]:
-                tags += self._get_tag_list(prog)
-        else:
-            tags = self._get_tag_list(program)
+        self._open_template_store()
+        try:
+            if program == "*":
+                tags = self._get_tag_list()
+                for prog in self._info["programs"]:
+                    tags += self._get_tag_list(prog)
+            else:
+                tags = self._get_tag_list(program)
+        finally:
+            self._close_template_store()
 
         if cache:
             self._tags = {tag["tag_name"]: tag for tag in tags}
@@ -445,6 +526,11 @@ class LogixDriver(CIPDriver):
         This service returns instance IDs for each created instance of the symbol class, along with a list
         of the attribute data associated with the requested attribute
         """
+        if self.revision_major >= MIN_VER_EXTERNAL_ACCESS:
+            attributes = _SYMBOL_ATTRS_ACCESS_REQUEST
+        else:
+            attributes = _SYMBOL_ATTRS_REQUEST
+
         try:
             last_instance = 0
             tag_list = []
@@ -457,16 +543,9 @@ class LogixDriver(CIPDriver):
                 if program:
                     if not program.startswith("Program:"):
                         program = f"Program:{program}"
-                    path = [
-                        EXTENDED_SYMBOL,
-                        USINT.encode(len(program)),
-                        program.encode("utf-8"),
-                    ]
                     segments = [
                         DataSegment(program),
                     ]
-                    if len(program) % 2:
-                        path.append(b"\x00")
 
                 segments += [
                     LogicalSegment(ClassCode.symbol_object, "class_id"),
@@ -475,24 +554,10 @@ class LogixDriver(CIPDriver):
 
                 new_path = PADDED_EPATH.encode(segments, length=True)
                 request = SendUnitDataRequestPacket(self._sequence)
-
-                attributes = [
-                    b"\x01\x00",  # Attr. 1: Symbol name
-                    b"\x02\x00",  # Attr. 2 : Symbol Type
-                    b"\x03\x00",  # Attr. 3 : Symbol Address
-                    b"\x05\x00",  # Attr. 5 : Symbol Object Address
-                    b"\x06\x00",  # Attr. 6 : ? - Not documented (Software Control?)
-                    b"\x08\x00",  # Attr. 8 : array dimensions [1,2,3]
-                ]
-
-                if self.revision_major >= MIN_VER_EXTERNAL_ACCESS:
-                    attributes.append(b"\x0a\x00")  # Attr. 10 : external access
-
                 request.add(
                     Services.get_instance_attribute_list,
                     new_path,
-                    UINT.encode(len(attributes)),
-                    *attributes,
+                    attributes,
                 )
                 response = self.send(request)
                 if not response:
@@ -513,39 +578,43 @@ class LogixDriver(CIPDriver):
     def _parse_instance_attribute_list(self, response, tag_list):
         """extract the tags list from the message received"""
 
-        stream = BytesIO(response.data)
-        tags_returned_length = stream.getbuffer().nbytes
-        count = instance = 0
-        # TODO: turn this into an array of struct with new types
+        data = response.data
+        data_length = len(data)
+        idx = instance = 0
+        if self.revision_major >= MIN_VER_EXTERNAL_ACCESS:
+            attrs_struct = _SYMBOL_INSTANCE_ATTRS_ACCESS
+        else:
+            attrs_struct = _SYMBOL_INSTANCE_ATTRS
         try:
-            while stream.tell() < tags_returned_length:
-                instance = UDINT.decode(stream)
-                tag_name = STRING.decode(stream)
-                symbol_type = UINT.decode(stream)
-                count += 1
-                symbol_address = UDINT.decode(stream)
-                symbol_object_address = UDINT.decode(stream)
-                software_control = UDINT.decode(stream)
-                dim1 = UDINT.decode(stream)
-                dim2 = UDINT.decode(stream)
-                dim3 = UDINT.decode(stream)
-
-                if self.revision_major >= MIN_VER_EXTERNAL_ACCESS:
-                    access = USINT.decode(stream)
-                else:
-                    access = None
+            while idx < data_length:
+                instance, name_length = _SYMBOL_INSTANCE_HEADER.unpack_from(data, idx)
+                idx += _SYMBOL_INSTANCE_HEADER.size
+                tag_name = data[idx : idx + name_length].decode(STRING.encoding)
+                idx += name_length
+                (
+                    symbol_type,
+                    symbol_address,
+                    symbol_object_address,
+                    software_control,
+                    dim1,
+                    dim2,
+                    dim3,
+                    *access,
+                ) = attrs_struct.unpack_from(data, idx)
+                idx += attrs_struct.size
+                access = access[0] if access else None
 
                 tag_list.append(
-                    {
-                        "instance_id": instance,
-                        "tag_name": tag_name,
-                        "symbol_type": symbol_type,
-                        "symbol_address": symbol_address,
-                        "symbol_object_address": symbol_object_address,
-                        "software_control": software_control,
-                        "external_access": EXTERNAL_ACCESS.get(access, "Unknown"),
-                        "dimensions": [dim1, dim2, dim3],
-                    }
+                    _SymbolInstance(
+                        instance,
+                        tag_name,
+                        symbol_type,
+                        symbol_address,
+                        symbol_object_address,
+                        software_control,
+                        EXTERNAL_ACCESS.get(access, "Unknown"),
+                        [dim1, dim2, dim3],
+                    )
                 )
 
         except Exception as err:
@@ -562,73 +631,86 @@ class LogixDriver(CIPDriver):
     def _isolate_user_tags(self, all_tags, program=None):
         try:
             user_tags = []
+            name_prefix = f"Program:{program}." if program is not None else ""  # built once, not for every tag
             self.__log.debug(f'Isolating user tags for {program or "controller"} ...')
             for tag in all_tags:
-                io_tag = False
-                name = tag["tag_name"]
-
-                if name.startswith("Program:"):
-                    prog_name = name.replace("Program:", "")
-                    self._info["programs"][prog_name] = {
-                        "instance_id": tag["instance_id"],
-                        "routines": [],
-                    }
-                    continue
+                name = tag.tag_name
+
+                # program, routine, task, system, and I/O module tags all have a ":", so most tags can skip those checks
+                if ":" in name:
+                    if name.startswith("Program:"):
+                        prog_name = name.replace("Program:", "")
+                        self._info["programs"][prog_name] = {
+                            "instance_id": tag.instance_id,
+                            "routines": [],
+                        }
+                        continue
+
+                    if name.startswith("Routine:"):
+                        rtn_name = name.replace("Routine:", "")
+                        _program = self._info["programs"].get(program)
+                        if _program is None:
+                            self.__log.error(f"Program {program} not defined in tag list")
+                        else:
+                            _program["routines"].append(rtn_name)
+                        continue
+
+                    if name.startswith("Task:"):
+                        self._info["tasks"][name.replace("Task:", "")] = {
+                            "instance_id": tag.instance_id
+                        }
+                        continue
+
+                    # system tags that may interfere w/ finding I/O modules
+                    if "Map:" in name or "Cxn:" in name:
+                        continue
+
+                    # I/O module tags
+                    # Logix 5000 Controllers I/O and Tag Data, page 17  (1756-pm004_-en-p.pdf)
+                    if _IO_TAG_PATTERN.search(name):
+                        mod = name.split(":")
+                        mod_name = mod[0]
+                        if mod_name not in self._info["modules"]:
+                            self._info["modules"][mod_name] = {"slots": {}}
+                        if len(mod) == 3 and mod[1].isdigit():
+                            mod_slot = int(mod[1])
+                            if mod_slot not in self._info["modules"][mod_name]:
+                                self._info["modules"][mod_name]["slots"][mod_slot] = {"types": []}
+                            self._info["modules"][mod_name]["slots"][mod_slot]["types"].append(mod[2])
+                        elif len(mod) == 2:
+                            if "types" not in self._info["modules"][mod_name]:
+                                self._info["modules"][mod_name]["types"] = []
+                            self._info["modules"][mod_name]["types"].append(mod[1])
+                        # Not sure if this branch will ever be hit, but added to see if above branches may need additional work
+                        else:
+                            if "__UNKNOWN__" not in self._info["modules"][mod_name]:
+                                self._info["modules"][mod_name]["__UNKNOWN__"] = []
+                            self._info["modules"][mod_name]["__UNKNOWN__"].append(":".join(mod[1:]))
 
-                if name.startswith("Routine:"):
-                    rtn_name = name.replace("Routine:", "")
-                    _program = self._info["programs"].get(program)
-                    if _program is None:
-                        self.__log.error(f"Program {program} not defined in tag list")
+                    # other system or junk tags
                     else:
-                        _program["routines"].append(rtn_name)
-                    continue
+                        continue
 
-                if name.startswith("Task:"):
-                    self._info["tasks"][name.replace("Task:", "")] = {
-                        "instance_id": tag["instance_id"]
-                    }
+                if name.startswith("__"):
                     continue
-
-                # system tags that may interfere w/ finding I/O modules
-                if "Map:" in name or "Cxn:" in name:
+                if tag.symbol_type & SYMBOL_TYPE_SYSTEM:
                     continue
 
-                # I/O module tags
-                # Logix 5000 Controllers I/O and Tag Data, page 17  (1756-pm004_-en-p.pdf)
-                if any(x in name for x in (":I", ":O", ":C", ":S")):
-                    io_tag = True
-                    mod = name.split(":")
-                    mod_name = mod[0]
-                    if mod_name not in self._info["modules"]:
-                        self._info["modules"][mod_name] = {"slots": {}}
-                    if len(mod) == 3 and mod[1].isdigit():
-                        mod_slot = int(mod[1])
-                        if mod_slot not in self._info["modules"][mod_name]:
-                            self._info["modules"][mod_name]["slots"][mod_slot] = {"types": []}
-                        self._info["modules"][mod_name]["slots"][mod_slot]["types"].append(mod[2])
-                    elif len(mod) == 2:
-                        if "types" not in self._info["modules"][mod_name]:
-                            self._info["modules"][mod_name]["types"] = []
-                        self._info["modules"][mod_name]["types"].append(mod[1])
-                    # Not sure if this branch will ever be hit, but added to see if above branches may need additional work
-                    else:
-                        if "__UNKNOWN__" not in self._info["modules"][mod_name]:
-                            self._info["modules"][mod_name]["__UNKNOWN__"] = []
-                        self._info["modules"][mod_name]["__UNKNOWN__"].append(":".join(mod[1:]))
-
-                # other system or junk tags
-                if (not io_tag and ":" in name) or name.startswith("__"):
-                    continue
-                if tag["symbol_type"] & 0b0001_0000_0000_0000:
-                    continue
+                if name_prefix:
+                    name = name_prefix + name
 
-                if program is not None:
-                    name = f"Program:{program}.{name}"
+                self._cache["tag_name:id"][name] = tag.instance_id
 
-                self._cache["tag_name:id"][name] = tag["instance_id"]
+                user_tags.append((name, tag))
 
-                user_tags.append(self._create_tag(name, tag))
+            self._prefetch_structure_makeups(
+                {
+                    tag.symbol_type & SYMBOL_TYPE_TEMPLATE_ID
+                    for _, tag in user_tags
+                    if tag.symbol_type & SYMBOL_TYPE_STRUCT
+                }
+            )
+            user_tags = [self._create_tag(name, tag) for name, tag in user_tags]
 
             self.__log.debug(f'Finished isolating tags for {program or "controller"}')
             return user_tags
@@ -636,36 +718,33 @@ class LogixDriver(CIPDriver):
             raise ResponseError("failed isolating user tags") from err
 
     def _create_tag(self, name, raw_tag):
-        copy_keys = [
-            "instance_id",
-            "symbol_address",
-            "symbol_object_address",
-            "software_control",
-            "external_access",
-            "dimensions",
-        ]
+        symbol_type = raw_tag.symbol_type
         new_tag = {
             "tag_name": name,
-            "dim": (raw_tag["symbol_type"] & 0b0110000000000000)
-            >> 13,  # bit 13 & 14, number of array dims
-            "alias": False if raw_tag["software_control"] & BASE_TAG_BIT else True,
-            **{k: raw_tag[k] for k in copy_keys},
+            "dim": (symbol_type & SYMBOL_TYPE_DIMS) >> SYMBOL_TYPE_DIMS_SHIFT,
+            "alias": False if raw_tag.software_control & BASE_TAG_BIT else True,
+            "instance_id": raw_tag.instance_id,
+            "symbol_address": raw_tag.symbol_address,
+            "symbol_object_address": raw_tag.symbol_object_address,
+            "software_control": raw_tag.software_control,
+            "external_access": raw_tag.external_access,
+            "dimensions": raw_tag.dimensions,
         }
 
-        if raw_tag["symbol_type"] & 0b_1000_0000_0000_0000:  # bit 15, 1 = struct, 0 = atomic
-            template_instance_id = raw_tag["symbol_type"] & 0b_0000_1111_1111_1111
+        if symbol_type & SYMBOL_TYPE_STRUCT:
+            template_instance_id = symbol_type & SYMBOL_TYPE_TEMPLATE_ID
             tag_type = "struct"
             new_tag["template_instance_id"] = template_instance_id
-            new_tag["data_type"] = self._get_data_type(template_instance_id, raw_tag["symbol_type"])
+            new_tag["data_type"] = self._get_data_type(template_instance_id, symbol_type)
             new_tag["data_type_name"] = new_tag["data_type"]["name"]
         else:
             tag_type = "atomic"
-            datatype = raw_tag["symbol_type"] & 0b_0000_0000_1111_1111
+            datatype = symbol_type & SYMBOL_TYPE_ATOMIC
             new_tag["data_type"] = DataTypes.get(datatype)
             new_tag["data_type_name"] = new_tag["data_type"]
             new_tag["type_class"] = DataTypes.get(new_tag["data_type"])
             if datatype == DataTypes.bool.code:  # TODO: make sure this is right
-                new_tag["bit_position"] = (raw_tag["symbol_type"] & 0b_0000_0111_0000_0000) >> 8
+                new_tag["bit_position"] = (symbol_type & SYMBOL_TYPE_BIT_POSITION) >> SYMBOL_TYPE_BIT_POSITION_SHIFT
 
         _type_class = (
             new_tag["data_type"]["type_class"]
@@ -689,85 +768,191 @@ class LogixDriver(CIPDriver):
         get the structure makeup for a specific structure
         """
         if instance_id not in self._cache["id:struct"]:
-            attrs = (
-                b"\x04\x00",  # Number of attributes
-                b"\x04\x00",  # Template Object Definition Size UDINT
-                b"\x05\x00",  # Template Structure Size UDINT
-                b"\x02\x00",  # Template Member Count UINT
-                b"\x01\x00",  # Structure Handle We can use this to read and write UINT
-            )
-
             response = self.generic_message(
                 service=Services.get_attribute_list,
                 class_code=ClassCode.template_object,
                 instance=instance_id,
                 connected=True,
-                request_data=b"".join(attrs),
+                request_data=_STRUCTURE_MAKEUP_ATTRS,
                 data_type=StructTemplateAttributes,
                 name=f"_get_structure_makeup(instance_id={instance_id!r})",
             )
             if not response:
                 raise ResponseError("send_unit_data returned not valid data", response.error)
-            _struct = _parse_structure_makeup_attributes(response)
-            self._cache["id:struct"][instance_id] = _struct
-            self._cache["handle:id"][_struct["structure_handle"]] = instance_id
+            self._cache_structure_makeup(instance_id, _parse_structure_makeup_attributes(response))
 
         return self._cache["id:struct"][instance_id]
 
+    def _cache_structure_makeup(self, instance_id, _struct):
+        self._cache["id:struct"][instance_id] = _struct
+        self._cache["handle:id"][_struct["structure_handle"]] = instance_id
+
+    def _prefetch_structure_makeups(self, instance_ids):
+        """
+        get the structure makeup for multiple structures using multi-service requests, any that fail are
+        left uncached so ``_get_structure_makeup`` will request them individually
+        """
+        instance_ids = [_id for _id in instance_ids if _id not in self._cache["id:struct"]]
+        if len(instance_ids) < 2 or self._micro800:
+            return
+
+        grouped_requests = [[]]
+        current_group = grouped_requests[0]
+        current_response_size = MULTISERVICE_READ_OVERHEAD
+        for instance_id in instance_ids:
+            if current_response_size + _STRUCTURE_MAKEUP_REPLY_SIZE > self.connection_size:
+                current_group = []
+                grouped_requests.append(current_group)
+                current_response_size = MULTISERVICE_READ_OVERHEAD
+
+            current_group.append(
+                GenericConnectedRequestPacket(
+                    self._sequence,
+                    service=Services.get_attribute_list,
+                    class_code=ClassCode.template_object,
+                    instance=instance_id,
+                    request_data=_STRUCTURE_MAKEUP_ATTRS,
+                    data_type=StructTemplateAttributes,
+                )
+            )
+            current_response_size += _STRUCTURE_MAKEUP_REPLY_SIZE
+
+        for group in grouped_requests:
+            try:
+                response = self.send(MultiServiceRequestPacket(self._sequence, group))
+                if not response:
+                    self.__log.debug(f"Multi-service structure makeup request failed: {response.error}")
+                    continue
+
+                for request, resp in zip(group, response.responses):
+                    _struct = _parse_structure_makeup_attributes(resp)
+                    if _struct:
+                        self._cache_structure_makeup(request.instance, _struct)
+            except Exception:
+                self.__log.exception("Failed to get structure makeups using a multi-service request")
+
+    def _open_template_store(self):
+        if self._template_cache_path:
+            try:
+                self._template_store = shelve.open(self._template_cache_path)
+            except Exception:
+                self.__log.exception(f"Failed to open template cache {self._template_cache_path!r}, not using cache")
+                self._template_store = None
+
+    def _close_template_store(self):
+        if self._template_store is not None:
+            try:
+                self._template_store.close()
+            except Exception:
+                self.__log.exception("Failed to close template cache")
+            finally:
+                self._template_store = None
+
+    def _get_template_data(self, instance_id, template):
+        """
+        Returns the raw template definition, from the template cache if possible else it is read from the controller.
+        """
+        serial = self._info.get("serial")
+        if self._template_store is None or serial is None:
+            return self._read_template(instance_id, template["object_definition_size"])
+
+        key = (
+            f'{serial}:{instance_id}:{template["structure_handle"]}:{template["object_definition_size"]}:'
+            f'{template["structure_size"]}:{template["member_count"]}'
+        )
+        try:
+            data = self._template_store.get(key)
+        except Exception:
+            self.__log.exception(f"Failed to load template {instance_id} from cache")
+            data = None
+
+        if data is None:
+            data = self._read_template(instance_id, template["object_definition_size"])
+            try:
+                self._template_store[key] = data
+            except Exception:
+                self.__log.exception(f"Failed to store template {instance_id} in cache")
+        else:
+            self.__log.debug(f"Using cached template for id {instance_id}")
+
+        return data
+
     def _read_template(self, instance_id, object_definition_size):
         """get a list of the tags in the plc"""
 
         offset = 0
-        template_raw = b""
+        fragment_size = 0
+        read_size = (object_definition_size * 4) - 21
+        depth = self._cfg["template_read_depth"]
+        template_raw = bytearray()
         try:
             while True:
-                response = self.generic_message(
-                    service=Services.read_tag,
-                    class_code=ClassCode.template_object,
-                    instance=instance_id,
-                    request_data=b"".join(
-                        (
-                            DINT.encode(offset),
-                            UINT.encode(((object_definition_size * 4) - 21) - offset),
-                        )
-                    ),
-                    name=f"_read_template(instance_id={instance_id}, object_definition_size={object_definition_size})",
-                    return_response_packet=True,
-                )
-                response_pkt = response.value
-                if response_pkt.service_status not in (SUCCESS, INSUFFICIENT_PACKETS):
-                    raise ResponseError("Error reading template", response)
+                if fragment_size and depth > 1:
+                    # fragment size is known after the first reply, so the next ones can be requested together
+                    fragments = self._read_template_fragments(instance_id, offset, read_size, fragment_size, depth)
+                else:
+                    response = self.generic_message(
+                        service=Services.read_tag,
+                        class_code=ClassCode.template_object,
+                        instance=instance_id,
+                        request_data=_READ_TEMPLATE_REQUEST.pack(offset, read_size - offset),
+                        name=f"_read_template(instance_id={instance_id}, object_definition_size={object_definition_size})",
+                        return_response_packet=True,
+                    )
+                    fragments = [(offset, response.value)]
+                    fragment_size = fragment_size or len(response.value.data)
+
+                for fragment_offset, response_pkt in fragments:
+                    if fragment_offset != offset:  # previous fragment was shorter than expected, request the rest again
+                        break
+
+                    if response_pkt.service_status not in (SUCCESS, INSUFFICIENT_PACKETS):
+                        raise ResponseError("Error reading template", response_pkt)
 
-                template_raw += response_pkt.data
+                    template_raw.extend(response_pkt.data)
 
-                if response_pkt.service_status == SUCCESS:
-                    break
+                    if response_pkt.service_status == SUCCESS:
+                        return bytes(template_raw)
 
-                offset += len(response_pkt.data)
+                    offset += len(response_pkt.data)
 
         except Exception as err:
             raise ResponseError("Failed to read template") from err
-        else:
-            return template_raw
+
+    def _read_template_fragments(self, instance_id, offset, read_size, fragment_size, depth):
+        """
+        Requests up to ``depth`` template fragments starting at ``offset``, assuming each reply is ``fragment_size``
+        bytes.  Returns a list of (offset, response) for each fragment requested.
+        """
+        offsets = list(range(offset, read_size, fragment_size)[:depth]) or [offset]
+        requests = [
+            GenericConnectedRequestPacket(
+                self._sequence,
+                service=Services.read_tag,
+                class_code=ClassCode.template_object,
+                instance=instance_id,
+                request_data=_READ_TEMPLATE_REQUEST.pack(_offset, read_size - _offset),
+            )
+            for _offset in offsets
+        ]
+        self.__log.debug(f"Requesting {len(requests)} fragments of template {instance_id} starting at {offset}")
+        return list(zip(offsets, self._send_pipelined(requests)))
 
     def _parse_template_data(self, data, template, symbol_type):
         info_len = template["member_count"] * TEMPLATE_MEMBER_INFO_LEN
-        info_data = data[:info_len]
         self.__log.debug(f"Parsing template {template!r} from {data!r}")
 
-        chunks = (
-            info_data[i : i + TEMPLATE_MEMBER_INFO_LEN]
-            for i in range(0, info_len, TEMPLATE_MEMBER_INFO_LEN)
-        )
-
-        member_data = [self._parse_template_data_member_info(chunk) for chunk in chunks]
+        member_data = [
+            self._parse_template_data_member_info(type_info, typ, offset)
+            for type_info, typ, offset in _TEMPLATE_MEMBER_INFO.iter_unpack(data[:info_len])
+        ]
 
         member_names = []
         template_name = None
         try:
-            for name in (
-                x.decode(errors="replace") for x in data[info_len:].split(b"\x00")
-            ):
+            # only the template name and one name per member are used, anything after that is not scanned
+            names = islice(_iter_template_names(data, info_len), template["member_count"] + 1)
+            for name in names:
                 if template_name is None and ";" in name:
                     template_name, _ = name.split(";", maxsplit=1)
                 else:
@@ -775,7 +960,7 @@ class LogixDriver(CIPDriver):
         except ValueError as err:
             raise ResponseError("Unable to decode template or member names") from err
 
-        _type = symbol_type & 0b_0000_1111_1111_1111
+        _type = symbol_type & SYMBOL_TYPE_TEMPLATE_ID
 
         # range of non-predefined structs is 0x100 - 0xEFF according to spec
         # so if outside that range assume it is a predefined type
@@ -839,18 +1024,15 @@ class LogixDriver(CIPDriver):
 
         return data_type
 
-    def _parse_template_data_member_info(self, info):
-        stream = BytesIO(info)
-        type_info = UINT.decode(stream)
-        typ = UINT.decode(stream)
-        member = {"offset": UDINT.decode(stream)}
+    def _parse_template_data_member_info(self, type_info, typ, offset):
+        member = {"offset": offset}
         tag_type = "atomic"
 
         data_type = DataTypes.get(typ)
         if data_type:
             type_class = DataTypes.get_type(typ)
         if data_type is None:
-            instance_id = typ & 0b0000_1111_1111_1111
+            instance_id = typ & SYMBOL_TYPE_TEMPLATE_ID
             type_class = DataTypes.get_type(instance_id)
             if type_class:
                 data_type = str(type_class)
@@ -880,7 +1062,7 @@ class LogixDriver(CIPDriver):
                 self.__log.debug(f"Getting data type for id {instance_id}")
                 template = self._get_structure_makeup(instance_id)  # instance id from type
                 if not template.get("error"):
-                    _data = self._read_template(instance_id, template["object_definition_size"])
+                    _data = self._get_template_data(instance_id, template)
                     data_type = self._parse_template_data(_data, template, symbol_type)
                     self._cache["id:udt"][instance_id] = data_type
                     self._data_types[data_type["name"]] = data_type
@@ -905,8 +1087,8 @@ class LogixDriver(CIPDriver):
         :return: a single or list of ``Tag`` objects
         """
 
-        parsed_requests = self._parse_requested_tags(tags, "r")
-        requests = self._read_build_requests(parsed_requests)
+        self._check_request_caches()
+        parsed_requests, requests = self._get_read_requests(tags)
         read_results = self._send_requests(requests)
 
         results = []
@@ -918,7 +1100,12 @@ class LogixDriver(CIPDriver):
                     results.append(Tag(tag, None, None, request_data["error"]))
                     continue
 
-                result = read_results[i]
+                if "duplicate_of" in request_data:
+                    result = read_results[request_data["duplicate_of"]]
+                    if isinstance(result.value, (list, dict)):
+                        result = result._replace(value=copy.deepcopy(result.value))
+                else:
+                    result = read_results[i]
                 bool_elements = request_data["bool_elements"]
                 if result:
                     bit = request_data.get("bit")
@@ -935,7 +1122,7 @@ class LogixDriver(CIPDriver):
                         bit = bit or 0
                         if bool_elements is not None:
                             bools = result.value[bit : bit + bool_elements]
-                            data_type = f"BOOL[{bool_elements}]"
+                            data_type = util.array_type_name("BOOL", bool_elements)
                             result = Tag(request_data["user_tag"], bools, data_type, result.error)
                         else:
                             val = result.value[bit % 32]
@@ -954,6 +1141,23 @@ class LogixDriver(CIPDriver):
         else:
             return results[0]
 
+    def _get_read_requests(self, tags):
+        """
+        Returns the parsed requests and request packets for reading ``tags``.  Packets are cached per
+        tag list and resent as-is (with a new sequence count) for repeated reads of the same tags.
+        """
+        key = (tags, self.connection_size, self._cfg["use_instance_ids"])
+        try:
+            cached = self._read_request_cache.get(key)
+        except TypeError:  # unhashable tag, not cached and the parser will report the error
+            key = cached = None
+        if cached is None:
+            parsed_requests = self._parse_requested_tags(tags, "r")
+            cached = parsed_requests, self._read_build_requests(parsed_requests)
+            if key is not None:
+                _cache_insert(self._read_request_cache, key, cached)
+        return cached
+
     def _read_build_requests(self, parsed_tags):
         if len(parsed_tags) != 1 and not self._micro800:
             return self._read_build_multi_requests(parsed_tags)
@@ -969,6 +1173,7 @@ class LogixDriver(CIPDriver):
         multi_requests = []
         fragmented_requests = []
         read_requests = []  # [ (request, response_size), ...]
+        requested = {}  # (plc tag, elements) -> request id, so each is only read once
         for request_id, tag_data in parsed_tags.items():
             if tag_data.get("error"):
                 self.__log.error(
@@ -976,6 +1181,13 @@ class LogixDriver(CIPDriver):
                 )
                 continue
 
+            # multiple bits of the same tag or the same tag requested more than once only needs one read
+            read_key = (tag_data["plc_tag"], tag_data["elements"])
+            if read_key in requested:
+                tag_data["duplicate_of"] = requested[read_key]
+                continue
+            requested[read_key] = request_id
+
             request = ReadTagRequestPacket(
                 self._sequence,
                 tag_data["plc_tag"],
@@ -984,6 +1196,7 @@ class LogixDriver(CIPDriver):
                 request_id,
                 self._cfg["use_instance_ids"],
             )
+            request.request_path = self._get_request_path(tag_data["plc_tag"], tag_data["tag_info"])
             request.build_message()
             # TODO: this isn't very accurate right now, the message len is not part of the response
             # so we may be fragmenting more than needed
@@ -1031,6 +1244,9 @@ class LogixDriver(CIPDriver):
                 parsed_tag["request_id"],
                 self._cfg["use_instance_ids"],
             )
+            request.request_path = self._get_request_path(
+                parsed_tag["plc_tag"], parsed_tag["tag_info"]
+            )
 
             return_size = _tag_return_size(parsed_tag) + len(request.message)
             if return_size > self.connection_size:
@@ -1059,6 +1275,7 @@ class LogixDriver(CIPDriver):
         if len(tags_values) == 2 and isinstance(tags_values[0], str):
             tags_values = ((*tags_values,),)
 
+        self._check_request_caches()
         tags = (tag for (tag, value) in tags_values)
         parsed_requests = self._parse_requested_tags(tags, "w")
 
@@ -1068,11 +1285,12 @@ class LogixDriver(CIPDriver):
         requests = self._write_build_requests(parsed_requests)
         write_results = self._send_requests(requests)
 
-        for r in requests:
-            if isinstance(r, ReadModifyWriteRequestPacket):
-                result = write_results.pop(r.request_id)
-                for req_id in r._request_ids:
-                    write_results[req_id] = result
+        for request in requests:
+            for r in request.requests if request.type_ == "multi" else (request,):
+                if isinstance(r, ReadModifyWriteRequestPacket):
+                    result = write_results.pop(r.request_id)
+                    for req_id in r._request_ids:
+                        write_results[req_id] = result
 
         results = []
         for i, (tag, value) in enumerate(tags_values):
@@ -1090,9 +1308,9 @@ class LogixDriver(CIPDriver):
                 if bit is not None and bool_elements is None:
                     data_type = "BOOL"
                 elif bool_elements:
-                    data_type = f"BOOL[{bool_elements}]"
+                    data_type = util.array_type_name("BOOL", bool_elements)
                 elif request_data["elements"] > 1:
-                    data_type = f'{data_type}[{request_data["elements"]}]'
+                    data_type = util.array_type_name(data_type, request_data["elements"])
 
                 user_result = Tag(request_data["user_tag"], value, data_type, result.error)
 
@@ -1125,18 +1343,21 @@ class LogixDriver(CIPDriver):
                 bit = tag_data.get("bit")
                 data_type = tag_data["tag_info"]["data_type_name"]
                 if bit is not None and tag_data["bool_elements"] is None:
-                    if tag_data["plc_tag"] not in bit_writes:
-
-                        request = ReadModifyWriteRequestPacket(
-                            self._sequence,
-                            tag_data["plc_tag"],
-                            tag_data["tag_info"],
-                            -1 * (1 + len(bit_writes)),
-                            self._cfg["use_instance_ids"],
-                        )
+                    request = bit_writes.get(tag_data["plc_tag"])
+                    if request is None:
+                        try:
+                            request = ReadModifyWriteRequestPacket(
+                                self._sequence,
+                                tag_data["plc_tag"],
+                                tag_data["tag_info"],
+                                -1 * (1 + len(bit_writes)),
+                                self._cfg["use_instance_ids"],
+                            )
+                        except RequestError as err:
+                            tag_data["error"] = f"Invalid Tag Request - {err!r}"
+                            self.__log.exception(f'Failed to build request for {tag_data["plc_tag"]} - skipping')
+                            continue
                         bit_writes[tag_data["plc_tag"]] = request
-                    else:
-                        request = bit_writes[tag_data["plc_tag"]]
 
                     request.set_bit(bit, tag_data["value"], tag_data["request_id"])
                     continue
@@ -1156,6 +1377,9 @@ class LogixDriver(CIPDriver):
                     self._cfg["use_instance_ids"],
                     tag_data["write_value"],
                 )
+                request.request_path = self._get_request_path(
+                    tag_data["plc_tag"], tag_data["tag_info"]
+                )
                 request.build_message()
                 request._msg_setup = False
 
@@ -1166,6 +1390,17 @@ class LogixDriver(CIPDriver):
                 else:
                     write_requests.append(request)
 
+        # bit writes are packed into the multi-service requests along with the other writes, unless the request
+        # failed to build or the tag is also in a fragmented write, those are sent last so the bits are applied last
+        fragmented_tags = {_base_tag(request.tag) for request in fragmented_requests}
+        last_bit_writes = []
+        for request in bit_writes.values():
+            if request.error or _base_tag(request.tag) in fragmented_tags:
+                last_bit_writes.append(request)
+            else:
+                request.build_message()
+                write_requests.append(request)
+
         grouped_requests = [
             [],
         ]
@@ -1189,7 +1424,7 @@ class LogixDriver(CIPDriver):
             if group
         ]
 
-        return multi_requests + fragmented_requests + [request for request in bit_writes.values()]
+        return multi_requests + fragmented_requests + last_bit_writes
 
     def _write_build_single_request(self, parsed_tag):
         if parsed_tag.get("error"):
@@ -1221,6 +1456,9 @@ class LogixDriver(CIPDriver):
                     self._cfg["use_instance_ids"],
                     parsed_tag["write_value"],
                 )
+                request.request_path = self._get_request_path(
+                    parsed_tag["plc_tag"], parsed_tag["tag_info"]
+                )
                 request.build_message()
                 request._msg_setup = False
 
@@ -1293,7 +1531,20 @@ class LogixDriver(CIPDriver):
     def _parse_tag_request(self, tag: str, rw="r") -> dict:
         """
         rw: read/write - because of how bool arrays always read from 0, but writing doesn't
+
+        Successfully parsed requests are cached, the returned dict is shared and must be copied before modifying it.
         """
+        try:
+            parsed = self._parsed_tag_cache.get((tag, rw))
+        except TypeError:  # unhashable, not a valid tag anyways so let the parser report the error
+            return self.__parse_tag_request(tag, rw)
+        if parsed is None:
+            parsed = self.__parse_tag_request(tag, rw)
+            if parsed is not None:
+                _cache_insert(self._parsed_tag_cache, (tag, rw), parsed)
+        return parsed
+
+    def __parse_tag_request(self, tag: str, rw="r") -> dict:
         try:
             if tag.endswith("}") and "{" in tag:
                 tag, _tmp = tag.split("{")
@@ -1342,6 +1593,29 @@ class LogixDriver(CIPDriver):
         except Exception as err:
             raise RequestError("Failed to parse tag request", tag) from err
 
+    def _check_request_caches(self):
+        """
+        Clears the per-tag request caches if the tag definitions have changed since they were built,
+        either from a new tag list upload or by replacing ``_tags`` directly.
+        """
+        if self._request_cache_tags is not self._tags:
+            self._request_path_cache.clear()
+            self._parsed_tag_cache.clear()
+            self._read_request_cache.clear()
+            self._request_cache_tags = self._tags
+
+    def _get_request_path(self, tag: str, tag_info: dict) -> Optional[bytes]:
+        """
+        Returns the encoded request path for ``tag``, reusing the cached path from a previous request if available.
+        """
+        key = (tag, self._cfg["use_instance_ids"])
+        path = self._request_path_cache.get(key)
+        if path is None:
+            path = tag_request_path(tag, tag_info, self._cfg["use_instance_ids"])
+            if path is not None:
+                _cache_insert(self._request_path_cache, key, path)
+        return path
+
     def _send_requests(self, requests):
         results = {}
 
@@ -1353,8 +1627,8 @@ class LogixDriver(CIPDriver):
                 if request.type_ != "multi":
                     results[request.request_id] = Tag(request.tag, None, None, str(err))
                 else:
-                    for tag in request.tags:
-                        results[tag["request_id"]] = Tag(tag["tag"], None, None, str(err))
+                    for req in request.requests:
+                        results[req.request_id] = Tag(req.tag, None, None, str(err))
             else:
                 if request.type_ != "multi":
                     if response:
@@ -1427,9 +1701,10 @@ class LogixDriver(CIPDriver):
             responses = []
             request.build_message()
             segment_size = self.connection_size - (len(request.message) - len(request.value))
+            value = memoryview(request.value)  # slice segments w/o copying the whole value for each fragment
             segments = (
-                request.value[i : i + segment_size]
-                for i in range(0, len(request.value), segment_size)
+                value[i : i + segment_size]
+                for i in range(0, len(value), segment_size)
             )
 
             offset = 0
@@ -1515,6 +1790,38 @@ def encode_value(parsed_tag: dict) -> bytes:
         raise RequestError("Unable to create a writable value") from err
 
 
+def _cache_insert(cache: dict, key, value):
+    """
+    Inserts ``value`` into a bounded request cache, evicting the oldest entry when full.
+    """
+    if len(cache) >= _REQUEST_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _iter_template_names(data: bytes, start: int):
+    """
+    Yields the null-separated names in ``data`` after ``start``, same tokens as ``data[start:].split(b"\\x00")``
+    but decoded from a memoryview instead of building a list of byte strings first.
+    """
+    view = memoryview(data)
+    pos = start
+    while True:
+        end = data.find(b"\x00", pos)
+        if end == -1:
+            yield str(view[pos:], "utf-8", "replace")
+            return
+        yield str(view[pos:end], "utf-8", "replace")
+        pos = end + 1
+
+
+def _base_tag(tag: str) -> str:
+    """
+    Returns the base tag name of a request tag, 'tag[1].member' -> 'tag'
+    """
+    return util.strip_array(tag.split(".", maxsplit=1)[0])
+
+
 def _tag_return_size(tag_data):
     tag_info = tag_data["tag_info"]
     if tag_info["tag_type"] == "atomic":
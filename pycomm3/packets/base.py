@@ -24,14 +24,19 @@
 
 import logging
 from reprlib import repr as _r
+from struct import Struct
 from typing import Optional
 
-from ..cip import DINT, UINT, UDINT
+from ..cip import UINT
 from ..const import SUCCESS
 from ..exceptions import CommError
 
 __all__ = ["Packet", "ResponsePacket", "RequestPacket"]
 
+_COMMAND_STATUS = Struct("<i")  # encapsulation status, bytes 8-12 of the header
+# encapsulation header: command, length, session handle, status (always 0), sender context, options
+_ENCAP_HEADER = Struct("<2sHI4x8sI")
+
 
 class Packet:
     __log = logging.getLogger(f"{__module__}.{__qualname__}")
@@ -85,9 +90,7 @@ class ResponsePacket(Packet):
     def _parse_reply(self):
         try:
             self.command = self.raw[:2]
-            self.command_status = DINT.decode(
-                self.raw[8:12]
-            )  # encapsulation status check
+            self.command_status = _COMMAND_STATUS.unpack_from(self.raw, 8)[0]  # encapsulation status check
         except Exception as err:
             self.__log.exception("Failed to parse reply")
             self._error = f"Failed to parse reply - {err}"
@@ -157,16 +160,7 @@ class RequestPacket(Packet):
          :return: the header
         """
         try:
-            return b"".join(
-                [
-                    command,
-                    UINT.encode(length),  # Length UINT
-                    UDINT.encode(session_id),  # Session Handle UDINT
-                    b"\x00\x00\x00\x00",  # Status UDINT
-                    context,  # Sender Context 8 bytes
-                    UDINT.encode(option),  # Option UDINT
-                ]
-            )
+            return _ENCAP_HEADER.pack(command, length, session_id, context, option)
 
         except Exception as err:
             raise CommError("Failed to build request header") from err
@@ -84,8 +84,14 @@ class GenericConnectedRequestPacket(SendUnitDataRequestPacket):
 
     def _setup_message(self):
         super()._setup_message()
+        self._msg.append(self.tag_only_message())
+
+    def tag_only_message(self):
+        """
+        The service request w/o the send_unit_data header, used to include it in a multi-service request
+        """
         req_path = request_path(self.class_code, self.instance, self.attribute)
-        self._msg += [self.service, req_path, self.request_data]
+        return b"".join((self.service, req_path, self.request_data))
 
 
 class GenericUnconnectedResponsePacket(SendRRDataResponsePacket):
@@ -24,7 +24,7 @@
 
 import logging
 from itertools import cycle
-from typing import Generator
+from struct import Struct
 
 from .base import RequestPacket, ResponsePacket
 from .util import get_extended_status, get_service_status
@@ -32,8 +32,6 @@ from .util import get_extended_status, get_service_status
 from ..cip import (
     MULTI_PACKET_SERVICES,
     UDINT,
-    UINT,
-    USINT,
     EncapsulationCommands,
     Services,
 )
@@ -41,6 +39,14 @@ from ..const import INSUFFICIENT_PACKETS, SUCCESS
 from ..custom_types import ListIdentityObject
 from ..map import EnumMap
 
+_SEQUENCE = Struct("<H")  # connected sequence count, first 2 bytes of a send_unit_data message
+
+# reply service code (request service | 0x80) -> request service, same result as
+# ``Services.get(Services.from_reply(...))`` without the decode/encode and map lookups per reply
+_REPLY_SERVICES = {
+    code: Services.get(Services.from_reply(bytes([code]))) for code in range(0x80, 0x100)
+}
+
 
 class DataItem(EnumMap):
     connected = b"\xb1\x00"
@@ -62,8 +68,8 @@ class SendUnitDataResponsePacket(ResponsePacket):
     def _parse_reply(self):
         try:
             super()._parse_reply()
-            self.service = Services.get(Services.from_reply(self.raw[46:47]))
-            self.service_status = USINT.decode(self.raw[48:49])
+            self.service = _REPLY_SERVICES[self.raw[46]]
+            self.service_status = self.raw[48]
             self.data = self.raw[50:]
         except Exception as err:
             self.__log.exception("Failed to parse reply")
@@ -102,17 +108,35 @@ class SendUnitDataRequestPacket(RequestPacket):
 
     def __init__(self, sequence: cycle):
         super().__init__()
-        self._sequence = next(sequence) if isinstance(sequence, Generator) else sequence
+        self._sequence = sequence if isinstance(sequence, int) else next(sequence)
+        self._request = None  # last built request, reused if the request is sent again
+        self._request_key = None
 
     def _setup_message(self):
         super()._setup_message()
-        self._msg.append(UINT.encode(self._sequence))
+        self._msg.append(_SEQUENCE.pack(self._sequence))
 
     def build_request(
         self, target_cid: bytes, session_id: int, context: bytes, option: int, **kwargs
     ):
-
-        return super().build_request(target_cid, session_id, context, option, **kwargs)
+        """
+        Builds the request, if the request has already been built and sent it is resent with
+        only the sequence count replaced with the next one from ``sequence``.
+        """
+        key = (target_cid, session_id, context, option)
+        sequence = kwargs.get("sequence")
+        resend = self._request is not None
+        if not resend or key != self._request_key:
+            self._request = super().build_request(target_cid, session_id, context, option, **kwargs)
+            self._request_key = key
+
+        if resend and sequence is not None:
+            self._sequence = sequence if isinstance(sequence, int) else next(sequence)
+            request = bytearray(self._request)
+            _SEQUENCE.pack_into(request, len(request) - len(self.message), self._sequence)
+            self._request = bytes(request)
+
+        return self._request
 
 
 class SendRRDataResponsePacket(ResponsePacket):
@@ -124,8 +148,8 @@ class SendRRDataResponsePacket(ResponsePacket):
     def _parse_reply(self):
         try:
             super()._parse_reply()
-            self.service = Services.get(Services.from_reply(self.raw[40:41]))
-            self.service_status = USINT.decode(self.raw[42:43])
+            self.service = _REPLY_SERVICES[self.raw[40]]
+            self.service_status = self.raw[42]
             self.data = self.raw[44:]
         except Exception as err:
             self.__log.exception("Failed to parse reply")
@@ -23,7 +23,9 @@
 #
 
 import logging
+from functools import lru_cache
 from itertools import tee, zip_longest
+from struct import Struct
 from reprlib import repr as _r
 from typing import Dict, Any, Sequence, Union
 
@@ -31,10 +33,50 @@ from ..util import cycle
 from .ethernetip import SendUnitDataRequestPacket, SendUnitDataResponsePacket
 from .util import parse_read_reply, request_path, tag_request_path
 
-from ..cip import ClassCode, Services, DataTypes, UINT, UDINT, ULINT
+from ..cip import (
+    ClassCode,
+    Services,
+    DataTypes,
+    SINT,
+    INT,
+    DINT,
+    LINT,
+    USINT,
+    UINT,
+    UDINT,
+    ULINT,
+    BYTE,
+    WORD,
+    DWORD,
+    LWORD,
+)
 from ..const import STRUCTURE_READ_REPLY
 from ..exceptions import RequestError
 
+# type codes for the elementary types, packed once instead of on every write request
+_PACKED_TYPE_CODES = {name.lower(): UINT.encode(DataTypes[name].code) for name in DataTypes.attributes}
+_STRUCT_TYPE_PREFIX = b"\xA0\x02"  # precedes the structure handle for writes to UDTs
+_pack_offset = Struct("<I").pack  # byte offset for fragmented services (UDINT)
+
+# read-modify-write: single bit masks and a packer for the mask size + or/and masks per size in bytes
+_BIT_MASKS = tuple(1 << bit for bit in range(64))
+_MASK_SIZES = {  # mask size in bytes for the types that support bit writes
+    typ.__name__.lower(): typ.size
+    for typ in (SINT, INT, DINT, LINT, USINT, UINT, UDINT, ULINT, BYTE, WORD, DWORD, LWORD)
+}
+_RMW_MASK_STRUCTS = {
+    size: (Struct(f"<H{fmt}{fmt}"), (1 << (size * 8)) - 1)
+    for size, fmt in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+}
+
+@lru_cache(maxsize=256)
+def _offsets_struct(count: int) -> Struct:
+    """
+    Returns a ``Struct`` for ``count`` UINTs, used to pack/unpack the service count and offset table
+    of multi-service requests and replies.
+    """
+    return Struct(f"<{count}H")
+
 
 class TagServiceResponsePacket(SendUnitDataResponsePacket):
     __log = logging.getLogger(f"{__module__}.{__qualname__}")
@@ -67,9 +109,14 @@ class TagServiceRequestPacket(SendUnitDataRequestPacket):
         self.request_id = request_id
         self._use_instance_id = use_instance_id
         self.request_path = None
+        self._tag_only_msg = None
 
     def tag_only_message(self):
-        return b"".join((self.tag_service, self.request_path, UINT.encode(self.elements)))
+        # the service, path, and element count don't change once the path is set,
+        # so build the message only once even if the request is packed multiple times
+        if self._tag_only_msg is None:
+            self._tag_only_msg = self.tag_service + self.request_path + UINT.encode(self.elements)
+        return self._tag_only_msg
 
 
 class ReadTagResponsePacket(TagServiceResponsePacket):
@@ -172,7 +219,7 @@ class ReadTagFragmentedRequestPacket(ReadTagRequestPacket):
 
     def _setup_message(self):
         super()._setup_message()
-        self._msg.append(UDINT.encode(self.offset))
+        self._msg.append(_pack_offset(self.offset))
 
     @classmethod
     def from_request(
@@ -229,16 +276,17 @@ class WriteTagRequestPacket(TagServiceRequestPacket):
         self._packed_data_type = None
 
         if tag_info["tag_type"] == "struct":
-            if not isinstance(value, (bytes, bytearray)):
+            if not isinstance(value, (bytes, bytearray, memoryview)):
                 raise RequestError("Writing UDTs only supports bytes for value")
-            self._packed_data_type = b"\xA0\x02" + UINT.encode(
+            self._packed_data_type = _STRUCT_TYPE_PREFIX + UINT.encode(
                 tag_info["data_type"]["template"]["structure_handle"]
             )
-
-        elif self.data_type not in DataTypes:
-            raise RequestError(f"Unsupported data type: {self.data_type!r}")
         else:
-            self._packed_data_type = UINT.encode(DataTypes[self.data_type].code)
+            self._packed_data_type = _PACKED_TYPE_CODES.get(
+                self.data_type.lower() if isinstance(self.data_type, str) else None
+            )
+            if self._packed_data_type is None:
+                raise RequestError(f"Unsupported data type: {self.data_type!r}")
 
     def _setup_message(self):
         super()._setup_message()
@@ -284,9 +332,8 @@ class WriteTagFragmentedRequestPacket(WriteTagRequestPacket):
         offset: int = 0,
         value: bytes = b"",
     ):
-        super().__init__(sequence, tag, elements, tag_info, request_id, use_instance_id)
+        super().__init__(sequence, tag, elements, tag_info, request_id, use_instance_id, value)
         self.offset = offset
-        self.value = value
 
     def tag_only_message(self):
         return b"".join(
@@ -295,7 +342,7 @@ class WriteTagFragmentedRequestPacket(WriteTagRequestPacket):
                 self.request_path,
                 self._packed_data_type,
                 UINT.encode(self.elements),
-                UDINT.encode(self.offset),
+                _pack_offset(self.offset),
                 self.value,
             )
         )
@@ -355,7 +402,7 @@ class ReadModifyWriteRequestPacket(SendUnitDataRequestPacket):
         self._request_ids = []
         self._and_mask = 0xFFFF_FFFF_FFFF_FFFF
         self._or_mask = 0x0000_0000_0000_0000
-        self._mask_size = DataTypes.get(self.data_type).size
+        self._mask_size = _MASK_SIZES.get(self.data_type.lower()) if isinstance(self.data_type, str) else None
 
         if self._mask_size is None:
             raise RequestError(f'Invalid data type {tag_info["data_type"]} for writing bits')
@@ -367,25 +414,30 @@ class ReadModifyWriteRequestPacket(SendUnitDataRequestPacket):
         if self.data_type == "DWORD":
             bit %= 32
 
+        mask = _BIT_MASKS[bit] if bit < 64 else 1 << bit  # out of range bits are masked off when packed
         if value:
-            self._or_mask |= 1 << bit
-            self._and_mask |= 1 << bit
+            self._or_mask |= mask
+            self._and_mask |= mask
         else:
-            self._or_mask &= ~(1 << bit)
-            self._and_mask &= ~(1 << bit)
+            self._or_mask &= ~mask
+            self._and_mask &= ~mask
 
         self.bits.append(bit)
         self._request_ids.append(request_id)
 
     def _setup_message(self):
         super()._setup_message()
-        self._msg += [
-            self.tag_service,
-            self.request_path,
-            UINT.encode(self._mask_size),
-            ULINT.encode(self._or_mask)[: self._mask_size],
-            ULINT.encode(self._and_mask)[: self._and_mask],
-        ]
+        self._msg.append(self.tag_only_message())
+
+    def tag_only_message(self):
+        _struct, size_mask = _RMW_MASK_STRUCTS[self._mask_size]
+        return b"".join(
+            (
+                self.tag_service,
+                self.request_path,
+                _struct.pack(self._mask_size, self._or_mask & size_mask, self._and_mask & size_mask),
+            )
+        )
 
 
 class MultiServiceResponsePacket(SendUnitDataResponsePacket):
@@ -400,12 +452,12 @@ class MultiServiceResponsePacket(SendUnitDataResponsePacket):
 
     def _parse_reply(self):
         super()._parse_reply()
-        num_replies = UINT.decode(self.data)
-        offset_data = self.data[2 : 2 + 2 * num_replies]
-        offsets = (UINT.decode(offset_data[i : i + 2]) for i in range(0, len(offset_data), 2))
+        num_replies = min(UINT.decode(self.data), (len(self.data) - 2) // 2)
+        offsets = _offsets_struct(num_replies).unpack_from(self.data, 2)
         start, end = tee(offsets)  # split offsets into start/end indexes
         next(end)  # advance end by 1 so 2nd item is the end index for the first item
-        reply_data = [self.data[i:j] for i, j in zip_longest(start, end)]
+        data = memoryview(self.data)  # slice without copying, each reply is copied once when padded below
+        reply_data = [data[i:j] for i, j in zip_longest(start, end)]
 
         padding = bytes(46)  # pad the front of the packet so it matches the size of
         # a read tag response, probably not the best idea but it works for now
@@ -434,13 +486,14 @@ class MultiServiceRequestPacket(SendUnitDataRequestPacket):
 
     def build_message(self):
         super().build_message()
-        num_requests = len(self.requests)
-        self._msg.append(UINT.encode(num_requests))
+        messages = [request.tag_only_message() for request in self.requests]
+        num_requests = len(messages)
         offset = 2 + (num_requests * 2)
         offsets = []
-        messages = [request.tag_only_message() for request in self.requests]
         for msg in messages:
-            offsets.append(UINT.encode(offset))
+            offsets.append(offset)
             offset += len(msg)
 
-        return b"".join(self._msg + offsets + messages)
+        header = _offsets_struct(num_requests + 1).pack(num_requests, *offsets)
+        self.message = b"".join((*self._msg, header, *messages))
+        return self.message
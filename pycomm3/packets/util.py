@@ -24,7 +24,9 @@
 
 import string
 
+from functools import lru_cache
 from io import BytesIO
+from itertools import chain
 from typing import Union, Optional
 
 from ..cip import (
@@ -42,7 +44,9 @@ from ..cip import (
     UINT,
     USINT,
 )
+from ..cip.data_types import _packed_array_struct, _BYTE_BITS
 from ..const import PRIORITY, TIMEOUT_TICKS, STRUCTURE_READ_REPLY
+from ..util import array_type_name
 
 __all__ = [
     "wrap_unconnected_send",
@@ -130,7 +134,9 @@ def tag_request_path(tag, tag_info, use_instance_ids):
     return None
 
 
+@lru_cache(maxsize=4096)
 def _find_tag_index(tag):
+    # cached since the same tag names are parsed for every request, index is a tuple so it can't be modified
     if "[" in tag:  # Check if is an array tag
         t = tag[: len(tag) - 1]  # Remove the last square bracket
         inside_value = t[t.find("[") + 1 :]  # Isolate the value inside bracket
@@ -140,7 +146,7 @@ def _find_tag_index(tag):
         tag = t[: t.find("[")]  # Get only the tag part
     else:
         index = []
-    return tag, index
+    return tag, tuple(index)
 
 
 def get_service_status(status) -> str:
@@ -177,11 +183,28 @@ def get_extended_status(msg, start) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=1024)
+def _scalar_struct(_type):
+    """
+    Struct to unpack a single value of ``_type`` (or a single element of an array of ``_type``)
+    from a read reply, None if it isn't a plain elementary type
+    """
+    if issubclass(_type, ArrayType):
+        _type = _type.element_type
+    return _packed_array_struct(_type, 1)
+
+
 def parse_read_reply(data, data_type, elements):
     dt_name = data_type["data_type_name"]
     _type = data_type["type_class"]
     is_struct = data[:2] == STRUCTURE_READ_REPLY
-    stream = BytesIO(data[4:] if is_struct else data[2:])
+    if elements == 1 and not is_struct:
+        _struct = _scalar_struct(_type)
+        if _struct is not None:  # atomic value, skip the stream and generic decoding
+            return _struct.unpack_from(data, 2)[0], dt_name
+
+    stream = BytesIO(data)  # skip the type code w/o copying the reply data into a new bytes object
+    stream.seek(4 if is_struct else 2)
     if issubclass(_type, ArrayType):
         _value = _type.decode(stream, length=elements)
 
@@ -195,20 +218,17 @@ def parse_read_reply(data, data_type, elements):
             }
 
     if dt_name == "DWORD":
-        dt_name = f"BOOL[{elements * 32}]"
+        dt_name = array_type_name("BOOL", elements * 32)
 
     elif elements > 1:
-        dt_name = f"{dt_name}[{elements}]"
+        dt_name = array_type_name(dt_name, elements)
 
     return _value, dt_name
 
 
 def dword_to_bool_array(dword: Union[bytes, int]):
     dword = UDINT.decode(dword) if isinstance(dword, bytes) else dword
-    bits = [x == "1" for x in bin(dword)[2:]]
-    bools = [False for _ in range(32 - len(bits))] + bits
-    bools.reverse()
-    return bools
+    return list(chain.from_iterable(_BYTE_BITS[byte] for byte in dword.to_bytes(4, "little")))
 
 
 def _to_hex(bites):
@@ -223,8 +243,12 @@ PRINTABLE = set(
 )
 
 
+# str.translate table replacing the non-printable characters of latin-1 decoded bytes
+_NON_PRINTABLE = str.maketrans({b: "•" for b in range(256) if b not in PRINTABLE})
+
+
 def _to_ascii(bites):
-    return "".join(f"{chr(b)}" if b in PRINTABLE else "•" for b in bites)
+    return bytes(bites).decode("latin-1").translate(_NON_PRINTABLE)
 
 
 def print_bytes_msg(msg):
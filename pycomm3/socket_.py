@@ -29,6 +29,8 @@ import struct
 from .exceptions import CommError
 from .const import HEADER_SIZE
 
+RECV_SIZE = 4096  # max bytes per recv, large enough for a reply of the largest connection size
+
 
 class Socket:
     __log = logging.getLogger(f"{__module__}.{__qualname__}")
@@ -37,6 +39,7 @@ class Socket:
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.sock.settimeout(timeout)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        self._buffer = bytearray()  # received bytes not yet returned by receive
 
     def connect(self, host, port):
         try:
@@ -62,14 +65,27 @@ class Socket:
         try:
             if timeout != 0:
                 self.sock.settimeout(timeout)
-            data = self.sock.recv(256)
-            data_len = struct.unpack_from("<H", data, 2)[0]
-            while len(data) - HEADER_SIZE < data_len:
-                data += self.sock.recv(256)
+            # return exactly one reply, anything after it is kept for the next call (e.g. when requests are pipelined)
+            self._fill(HEADER_SIZE)
+            size = HEADER_SIZE + struct.unpack_from("<H", self._buffer, 2)[0]
+            self._fill(size)
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
 
             return data
         except socket.error as err:
             raise CommError("socket connection broken") from err
 
+    def _fill(self, size: int):
+        """
+        Receives until at least ``size`` bytes are buffered
+        """
+        while len(self._buffer) < size:
+            chunk = self.sock.recv(max(RECV_SIZE, size - len(self._buffer)))
+            if not chunk:
+                raise CommError("socket connection broken")
+            self._buffer += chunk
+
     def close(self):
+        self._buffer.clear()
         self.sock.close()
@@ -27,6 +27,8 @@
 Various utility functions.
 """
 
+from functools import lru_cache
+from itertools import chain, repeat
 from typing import Tuple
 
 
@@ -57,11 +59,23 @@ def get_array_index(tag: str) -> Tuple[str, int]:
     return tag, idx
 
 
+@lru_cache(maxsize=1024)
+def array_type_name(data_type: str, elements: int) -> str:
+    """
+    Return the data type name for an array of ``elements``, cached since
+    the same names are built for every read of a tag
+
+    ('DINT', 10) -> 'DINT[10]'
+    """
+    return f"{data_type}[{elements}]"
+
+
 def cycle(stop, start=0):
-    val = start
-    while True:
-        if val > stop:
-            val = start
+    """
+    Endlessly counts from ``start`` to ``stop`` (inclusive), then starts over
 
-        yield val
-        val += 1
+    Built from itertools instead of a generator so ``next()`` runs entirely in C w/o
+    any Python frames, so it's faster and can't fail with 'generator already executing'
+    if the same counter is shared between threads.
+    """
+    return chain.from_iterable(repeat(range(start, stop + 1)))
@@ -1,3 +1,6 @@
+import struct
+
+
 class Mocket:
     """
     A mocked socket
@@ -19,3 +22,27 @@ class Mocket:
 
     def connect(self, *args, **kwargs):
         ...
+
+
+def service_reply(service: int, status: int = 0, data: bytes = b'') -> bytes:
+    """reply to a connected ``service`` request: reply service, reserved, status, no extended status"""
+    return bytes([service | 0x80, 0, status, 0]) + data
+
+
+def multi_service_reply(*replies: bytes, status: int = 0) -> bytes:
+    """multi-service reply with the offset table for the ``service_reply`` s in ``replies``"""
+    offset = 2 + 2 * len(replies)
+    offsets = []
+    for reply in replies:
+        offsets.append(offset)
+        offset += len(reply)
+    table = struct.pack(f'<{len(replies) + 1}H', len(replies), *offsets)
+    return service_reply(0x0A, status, table + b''.join(replies))
+
+
+def unit_data_reply(message: bytes, sequence: int = 1) -> bytes:
+    """send_unit_data encapsulation frame for a connected reply ``message``"""
+    body = struct.pack('<H', sequence) + message
+    cpf = bytes(6) + b'\x02\x00\xa1\x00\x04\x00' + bytes(4) + b'\xb1\x00' + struct.pack('<H', len(body)) + body
+    return b'\x70\x00' + struct.pack('<H', len(cpf)) + bytes(20) + cpf
+
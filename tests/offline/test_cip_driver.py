@@ -7,6 +7,8 @@ methods through the public API. This has lead to testing of quite a few
 private API methods to achieve an acceptable test coverage.
 """
 import itertools
+import socket
+import struct
 from unittest import mock
 
 import pytest
@@ -23,9 +25,10 @@ from pycomm3 import (
     ResponseError,
     parse_connection_path,
 )
+from pycomm3.packets import GenericConnectedRequestPacket
 from pycomm3.socket_ import Socket
 
-from . import Mocket
+from . import Mocket, service_reply, unit_data_reply
 
 CONNECT_PATH = "192.168.1.100"
 
@@ -288,3 +291,53 @@ def test__forward_open_raises_commerror_if_session_is_zero():
     driver = CIPDriver(CONNECT_PATH)
     with pytest.raises(CommError):
         driver._forward_open()
+
+
+def _pipelined_driver():
+    driver = CIPDriver(CONNECT_PATH)
+    driver._sock = Socket()
+    driver._sock.sock.close()
+    driver._sock.sock, peer = socket.socketpair()
+    driver._sock.sock.settimeout(1)  # fail instead of hanging if a reply is read wrong
+    driver._session = 1
+    driver._target_is_connected = True
+    driver._connection_opened = True
+    driver._target_cid = bytes(4)
+    return driver, peer
+
+
+def _pipelined_requests(driver, count):
+    return [GenericConnectedRequestPacket(driver._sequence, b"\x4c", 0x6C, 1) for _ in range(count)]
+
+
+def test__send_pipelined_matches_back_to_back_replies_of_mixed_sizes():
+    replies = [
+        unit_data_reply(service_reply(0x4C, 6, b"\x01" * 400)),
+        unit_data_reply(service_reply(0x4C, 5)),  # short error reply between two large ones
+        unit_data_reply(service_reply(0x4C, 6, b"\x02" * 150)),
+        unit_data_reply(service_reply(0x4C, 0, b"\x03" * 20)),
+    ]
+    follow_up = unit_data_reply(service_reply(0x4C, 0, b"\x04" * 8))
+    driver, peer = _pipelined_driver()
+    try:
+        peer.sendall(b"".join(replies) + follow_up)
+        responses = driver._send_pipelined(_pipelined_requests(driver, len(replies)))
+
+        assert [resp.service_status for resp in responses] == [6, 5, 6, 0]
+        assert [resp.data for resp in responses] == [b"\x01" * 400, b"", b"\x02" * 150, b"\x03" * 20]
+        assert driver._sock.receive() == follow_up  # the replies after the window are still in sync
+    finally:
+        peer.close()
+        driver._sock.close()
+
+
+def test__send_pipelined_closes_connection_if_a_reply_fails():
+    driver, peer = _pipelined_driver()
+    peer.sendall(unit_data_reply(service_reply(0x4C, 6, b"\x01" * 400)))
+    peer.close()  # connection lost before the rest of the replies
+    with pytest.raises(CommError):
+        driver._send_pipelined(_pipelined_requests(driver, 3))
+
+    assert driver._sock is None
+    assert not driver._target_is_connected
+
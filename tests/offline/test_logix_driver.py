@@ -20,19 +20,26 @@ pycomm3/logix_driver.py                   798    718    346      0     7%
 We're currently at 7% test coverage, I would like to increase that to >=50%
 and then continue to do so for the rest of the modules.
 """
+import struct
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 
 from pycomm3.cip_driver import CIPDriver
-from pycomm3.const import MICRO800_PREFIX, SUCCESS
+from pycomm3.const import MICRO800_PREFIX, SUCCESS, INSUFFICIENT_PACKETS, MULTISERVICE_READ_OVERHEAD
 from pycomm3.exceptions import CommError, PycommError, RequestError
-from pycomm3.logix_driver import LogixDriver, encode_value
-from pycomm3.packets import RequestPacket, ResponsePacket
+from pycomm3.logix_driver import LogixDriver, encode_value, _SymbolInstance
+from pycomm3.packets import (
+    RequestPacket, ResponsePacket, WriteTagRequestPacket, WriteTagFragmentedRequestPacket,
+    MultiServiceRequestPacket, ReadModifyWriteRequestPacket,
+)
 from pycomm3.socket_ import Socket
 from pycomm3.tag import Tag
 from pycomm3.custom_types import ModuleIdentityObject
 
+from . import multi_service_reply, service_reply, unit_data_reply
+
 CONNECT_PATH = '192.168.1.100/1'
 
 IDENTITY_CLX_V20 = {'vendor': 'Rockwell Automation/Allen-Bradley',
@@ -251,3 +258,263 @@ def test__get_tag_list_returns_expected_user_tags():
         mock_send.return_value = TEST_RESPONSE
         actual_tags = ld.get_tag_list()
     assert EXPECTED_USER_TAGS == actual_tags
+
+
+def test_write_unhashable_tag_returns_error_tag():
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False)
+    ld._target_is_connected = True
+    result = ld.write((['a'], 1))
+
+    assert result.tag == ['a']
+    assert result.error
+
+
+def test_read_unhashable_tag_returns_error_tag():
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False)
+    ld._target_is_connected = True
+    results = ld.read('a', ['b'])
+
+    assert [result.tag for result in results] == ['a', ['b']]
+    assert all(result.error for result in results)
+
+
+def test_repeated_read_resends_cached_request_with_next_sequence():
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False)
+    ld._target_is_connected = True
+    ld._session = 1
+    ld._target_cid = b'\x01\x02\x03\x04'
+    ld._tags = {
+        'dint': ld._create_tag('dint', _SymbolInstance(1, 'dint', 0xC4, 0, 0, 0, 'Read/Write', [0, 0, 0]))
+    }
+    replies = [unit_data_reply(service_reply(0x4C, data=b'\xc4\x00' + struct.pack('<i', value))) for value in (1, 2)]
+    sent = []
+    with mock.patch.object(LogixDriver, '_send', side_effect=sent.append), \
+            mock.patch.object(LogixDriver, '_receive', side_effect=replies):
+        first = ld.read('dint')
+        second = ld.read('dint')
+
+    assert (first.value, second.value) == (1, 2)
+    seq_offset = 44  # encapsulation header + cpf before the connected sequence count
+    first_seq, = struct.unpack_from('<H', sent[0], seq_offset)
+    second_seq, = struct.unpack_from('<H', sent[1], seq_offset)
+    assert second_seq == first_seq + 1
+    assert sent[0][:seq_offset] == sent[1][:seq_offset]
+    assert sent[0][seq_offset + 2:] == sent[1][seq_offset + 2:]
+
+
+def test_write_fragmented_udt_segment_from_memoryview():
+    tag_info = {
+        'tag_type': 'struct', 'data_type_name': 'MyUDT', 'instance_id': 1,
+        'data_type': {'template': {'structure_handle': 0x1234}},
+    }
+    request = WriteTagRequestPacket(1, 'udt', 1, tag_info, 0, True, b'\x01\x02\x03\x04')
+    fragment = WriteTagFragmentedRequestPacket.from_request(
+        iter(range(2, 10)), request, 2, memoryview(request.value)[2:]
+    )
+    fragment.build_message()
+    assert fragment.message.endswith(b'\x02\x00\x00\x00\x03\x04')  # offset + segment
+
+    with pytest.raises(RequestError):
+        WriteTagFragmentedRequestPacket(1, 'udt', 1, tag_info, 0, True, value='not bytes')
+
+
+def test_read_template_pipelines_fragments_after_first_reply():
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False, template_read_depth=4)
+    template = bytes(i % 256 for i in range(256 * 4 - 21))
+
+    def reply(offset):
+        data = template[offset:offset + 100]
+        status = SUCCESS if offset + 100 >= len(template) else INSUFFICIENT_PACKETS
+        return SimpleNamespace(service_status=status, data=data)
+
+    single, windows = [], []
+
+    def generic_message(request_data, **kwargs):
+        offset, _ = struct.unpack('<iH', request_data)
+        single.append(offset)
+        return Tag('', reply(offset))
+
+    def send_pipelined(requests):
+        offsets = [struct.unpack('<iH', request.request_data)[0] for request in requests]
+        windows.append(offsets)
+        return [reply(offset) for offset in offsets]
+
+    with mock.patch.object(ld, 'generic_message', side_effect=generic_message), \
+            mock.patch.object(ld, '_send_pipelined', side_effect=send_pipelined):
+        assert ld._read_template(1, 256) == template
+
+    assert single == [0]
+    assert windows == [[100, 200, 300, 400], [500, 600, 700, 800], [900, 1000]]
+
+
+def _connected_driver(**tags):
+    """driver with a connection already 'open' and the DINT (array) tags ``{name: element count}``"""
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False)
+    ld._target_is_connected = True
+    ld._session = 1
+    ld._target_cid = b'\x01\x02\x03\x04'
+    ld._tags = {
+        name: ld._create_tag(name, _SymbolInstance(
+            i, name, 0xC4 | (0x2000 if elements > 1 else 0), 0, 0, 0, 'Read/Write', [elements if elements > 1 else 0, 0, 0]
+        ))
+        for i, (name, elements) in enumerate(tags.items(), start=1)
+    }
+    return ld
+
+
+def test_write_tag_and_bits_in_one_multi_service_request():
+    ld = _connected_driver(dint=1, flags=1)
+    reply = unit_data_reply(multi_service_reply(service_reply(0x4D), service_reply(0x4E)))
+    with mock.patch.object(LogixDriver, '_send') as mock_send, \
+            mock.patch.object(LogixDriver, '_receive', return_value=reply):
+        results = ld.write(('dint', 5), ('flags.0', True), ('flags.3', False))
+
+    assert mock_send.call_count == 1
+    assert results == [
+        Tag('dint', 5, 'DINT', None),
+        Tag('flags.0', True, 'BOOL', None),
+        Tag('flags.3', False, 'BOOL', None),
+    ]
+
+
+def test_write_bit_of_fragmented_array_is_sent_last():
+    ld = _connected_driver(big_array=200, dint=1)
+    ld._cfg['connection_size'] = 500
+    parsed = ld._parse_requested_tags(('big_array{200}', 'big_array[3].1', 'dint', 'dint.2'), 'w')
+    for i, value in enumerate(([1] * 200, True, 5, True)):
+        parsed[i]['value'] = value
+
+    multi, fragmented, bit_write = ld._write_build_requests(parsed)
+
+    assert isinstance(multi, MultiServiceRequestPacket)
+    assert [(type(r), r.tag) for r in multi.requests] == [
+        (WriteTagRequestPacket, 'dint'), (ReadModifyWriteRequestPacket, 'dint')
+    ]
+    assert isinstance(fragmented, WriteTagFragmentedRequestPacket) and fragmented.tag == 'big_array'
+    assert isinstance(bit_write, ReadModifyWriteRequestPacket) and bit_write.tag == 'big_array[3]'
+
+
+
+TEMPLATE = {'object_definition_size': 10, 'structure_handle': 0x1234, 'structure_size': 8, 'member_count': 2}
+
+
+def _template_cache_driver(path, serial='12345678'):
+    ld = LogixDriver(CONNECT_PATH, init_info=False, init_tags=False, template_cache_path=str(path))
+    if serial is not None:
+        ld._info['serial'] = serial
+    return ld
+
+
+def _get_template_data(ld, template=TEMPLATE, instance_id=1):
+    ld._open_template_store()
+    try:
+        with mock.patch.object(ld, '_read_template', return_value=b'template data') as mock_read:
+            assert ld._get_template_data(instance_id, template) == b'template data'
+    finally:
+        ld._close_template_store()
+    return mock_read.call_count
+
+
+def test_template_cache_used_on_next_upload(tmp_path):
+    path = tmp_path / 'templates'
+    assert _get_template_data(_template_cache_driver(path)) == 1
+    assert _get_template_data(_template_cache_driver(path)) == 0
+
+
+@pytest.mark.parametrize('changed', [
+    {'structure_handle': 0x4321}, {'structure_size': 12}, {'object_definition_size': 11}, {'member_count': 3},
+])
+def test_template_cache_misses_on_changed_template(tmp_path, changed):
+    ld = _template_cache_driver(tmp_path / 'templates')
+    assert _get_template_data(ld) == 1
+    assert _get_template_data(ld, {**TEMPLATE, **changed}) == 1
+    assert _get_template_data(ld) == 0
+
+
+def test_template_cache_not_used_without_serial(tmp_path):
+    ld = _template_cache_driver(tmp_path / 'templates', serial=None)
+    assert _get_template_data(ld) == 1
+    assert _get_template_data(ld) == 1
+
+
+def test_template_cache_falls_back_if_it_fails_to_open(tmp_path):
+    ld = _template_cache_driver(tmp_path / 'missing' / 'templates')
+    assert _get_template_data(ld) == 1
+    assert ld._template_store is None
+    assert _get_template_data(ld) == 1
+
+
+def _structure_makeup_reply(definition_size, structure_size, member_count, handle):
+    return service_reply(0x03, data=struct.pack(
+        '<HHHIHHIHHHHHH', 4, 4, 0, definition_size, 5, 0, structure_size, 2, 0, member_count, 1, 0, handle
+    ))
+
+
+def test_prefetch_structure_makeups_caches_only_good_replies():
+    ld = _connected_driver()
+    ld._cache = {'id:struct': {}, 'handle:id': {}}
+    replies = [
+        unit_data_reply(multi_service_reply(_structure_makeup_reply(10, 8, 2, 0x1234), service_reply(0x03, 5))),
+        unit_data_reply(_structure_makeup_reply(20, 16, 4, 0x4321)),
+    ]
+    with mock.patch.object(LogixDriver, '_send') as mock_send, \
+            mock.patch.object(LogixDriver, '_receive', side_effect=replies):
+        ld._prefetch_structure_makeups([0x100, 0x200])
+        assert mock_send.call_count == 1
+        assert ld._cache['id:struct'] == {
+            0x100: {'object_definition_size': 10, 'structure_size': 8, 'member_count': 2, 'structure_handle': 0x1234}
+        }
+
+        assert ld._get_structure_makeup(0x200)['structure_handle'] == 0x4321
+        assert ld._get_structure_makeup(0x100)['structure_handle'] == 0x1234
+        assert mock_send.call_count == 2
+
+
+@pytest.mark.parametrize('micro800, sends', [(False, 2), (True, 0)])
+def test_prefetch_structure_makeups_groups_by_connection_size(micro800, sends):
+    ld = _connected_driver()
+    ld._cache = {'id:struct': {}, 'handle:id': {}}
+    ld._micro800 = micro800
+    ld._cfg['connection_size'] = MULTISERVICE_READ_OVERHEAD + 2 * 36  # room for 2 structure makeup replies
+    reply = unit_data_reply(multi_service_reply(service_reply(0x03, 5), service_reply(0x03, 5)))
+    with mock.patch.object(LogixDriver, '_send') as mock_send, \
+            mock.patch.object(LogixDriver, '_receive', return_value=reply):
+        ld._prefetch_structure_makeups([1, 2, 3])
+
+    assert mock_send.call_count == sends
+    assert ld._cache['id:struct'] == {}
+
+
+def test_read_duplicate_tags_sent_once():
+    ld = _connected_driver(a=2, b=1)
+    reply = unit_data_reply(multi_service_reply(
+        service_reply(0x4C, data=b'\xc4\x00' + struct.pack('<2i', 1, 2)),
+        service_reply(0x4C, data=b'\xc4\x00' + struct.pack('<i', 2)),
+    ))
+    with mock.patch.object(LogixDriver, '_send'), \
+            mock.patch.object(LogixDriver, '_receive', return_value=reply), \
+            mock.patch.object(ld, 'send', wraps=ld.send) as mock_send:
+        results = ld.read('a{2}', 'b', 'b.1', 'a{2}')
+
+    request, = (call.args[0] for call in mock_send.call_args_list)
+    assert isinstance(request, MultiServiceRequestPacket)
+    assert [(r.tag, r.elements) for r in request.requests] == [('a', 2), ('b', 1)]
+    assert results == [
+        Tag('a', [1, 2], 'DINT[2]', None),
+        Tag('b', 2, 'DINT', None),
+        Tag('b.1', True, 'BOOL', None),
+        Tag('a', [1, 2], 'DINT[2]', None),
+    ]
+    assert results[0].value is not results[3].value
+
+
+@pytest.mark.parametrize('value, or_mask, and_mask', [
+    (True, b'\x08\x00\x00\x00', b'\xff\xff\xff\xff'),
+    (False, b'\x00\x00\x00\x00', b'\xf7\xff\xff\xff'),
+])
+def test_read_modify_write_dint_bit_masks(value, or_mask, and_mask):
+    tag_info = {'tag_type': 'atomic', 'data_type': 'DINT', 'data_type_name': 'DINT', 'instance_id': 1}
+    request = ReadModifyWriteRequestPacket(1, 'dint', tag_info, -1)
+    request.set_bit(3, value, 0)
+
+    assert request.tag_only_message() == b'\x4e' + request.request_path + b'\x04\x00' + or_mask + and_mask
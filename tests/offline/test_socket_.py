@@ -12,8 +12,6 @@ These tests currently bind the code fairly tightly to Python's socket
 object, but in this instance I think that's okay as I don't forsee this
 changing any time soon, and if it did I would rather that be obvious by
 breaking these tests.
-
-The only remaining untested code in Socket is the while loop in receive
 """
 import socket
 from unittest import mock
@@ -97,15 +95,24 @@ DATA_LEN_BYTES = struct.pack('<HH', 0, DATA_LEN)
 NULL_HEADER_W_DATA_LEN = DATA_LEN_BYTES.ljust(pycomm3.const.HEADER_SIZE, b'\x00') # len 256
 RECVD_BYTES = b"These are the bytes we will recv"
 FULL_RECV_MSG = (NULL_HEADER_W_DATA_LEN + RECVD_BYTES).ljust(DATA_LEN+pycomm3.const.HEADER_SIZE, b'\x00')
-def test_socket_receive_calls_recv_once_when_data_ge_data_len():
+def test_socket_receive_reads_reply_with_one_recv():
     with mock.patch.object(socket.socket, 'recv') as mock_socket_recv:
-        mock_socket_recv.return_value = FULL_RECV_MSG
+        mock_socket_recv.side_effect = [FULL_RECV_MSG]
 
         my_sock = Socket()
         response = my_sock.receive()
 
-        mock_socket_recv.assert_called_once()
-        assert RECVD_BYTES in response
+        assert mock_socket_recv.call_count == 1
+        assert response == FULL_RECV_MSG
+
+def test_socket_receive_keeps_bytes_of_next_reply():
+    with mock.patch.object(socket.socket, 'recv') as mock_socket_recv:
+        mock_socket_recv.side_effect = [FULL_RECV_MSG + FULL_RECV_MSG[:10], FULL_RECV_MSG[10:]]
+
+        my_sock = Socket()
+        assert my_sock.receive() == FULL_RECV_MSG
+        assert my_sock.receive() == FULL_RECV_MSG
+        assert mock_socket_recv.call_count == 2
 
 def test_socket_receive_sets_timeout():
     TIMEOUT_VALUE = 1
@@ -133,6 +140,44 @@ def test_socket_receive_returns_correct_amount_received_bytes():
         assert RECVD_BYTES in response
         assert len(response) - pycomm3.const.HEADER_SIZE == DATA_LEN
 
+def test_socket_receive_reassembles_partial_recvs():
+    DATA_LEN = 4352
+    FULL_MSG = struct.pack('<HH', 0, DATA_LEN).ljust(DATA_LEN + pycomm3.const.HEADER_SIZE, b'\x01')
+    chunks = [FULL_MSG[:10], FULL_MSG[10:24], FULL_MSG[24:1000], FULL_MSG[1000:]]
+    with mock.patch.object(socket.socket, 'recv') as mock_socket_recv:
+        mock_socket_recv.side_effect = chunks
+
+        my_sock = Socket()
+        response = my_sock.receive()
+
+        assert response == FULL_MSG
+        assert mock_socket_recv.call_count == len(chunks)
+
+def test_socket_receive_raises_commerror_on_closed_connection():
+    with mock.patch.object(socket.socket, 'recv') as mock_socket_recv:
+        mock_socket_recv.side_effect = [FULL_RECV_MSG[:pycomm3.const.HEADER_SIZE], b'']
+
+        my_sock = Socket()
+        with pytest.raises(CommError):
+            my_sock.receive()
+
+def test_socket_receive_does_not_read_past_reply():
+    """Pipelined replies arrive back-to-back, each receive must return only one of them."""
+    replies = [
+        struct.pack('<HH', 0, size).ljust(pycomm3.const.HEADER_SIZE + size, bytes([size % 256]))
+        for size in (40, 300, 6, 1000)
+    ]
+    my_sock = Socket()
+    my_sock.sock.close()
+    my_sock.sock, peer = socket.socketpair()
+    my_sock.sock.settimeout(1)
+    try:
+        peer.sendall(b''.join(replies))
+        assert [my_sock.receive() for _ in replies] == replies
+    finally:
+        peer.close()
+        my_sock.close()
+
 def test_socket_receive_raises_commerror_opn_socketerror():
     with mock.patch.object(socket.socket, 'recv') as mock_socket_recv:
         mock_socket_recv.side_effect = socket.error
@@ -1,4 +1,6 @@
-from pycomm3 import n_bytes
+import pytest
+
+from pycomm3 import n_bytes, Array, DINT, INT, REAL, LREAL, SINT, UDINT, BufferEmptyError, DataError
 from pycomm3.custom_types import ModuleIdentityObject
 from io import BytesIO
 
@@ -38,5 +40,30 @@ def test_n_bytes():
     assert not stream.read()
 
 
+@pytest.mark.parametrize('typ, values', [
+    (SINT, [-128, 0, 127]),
+    (INT, [-1, 2, 3]),
+    (DINT, [-100_000, 0, 100_000]),
+    (UDINT, [0, 1, 0xFFFF_FFFF]),
+    (REAL, [1.5, -2.25, 0.0]),
+    (LREAL, [1e100, -1e-100, 3.0]),
+])
+def test_array_encode_matches_elements(typ, values):
+    expected = b''.join(typ.encode(v) for v in values)
+    assert Array(len(values), typ).encode(values) == expected
+    assert Array(None, typ).encode(values) == expected
+
+
+def test_array_decode_packed():
+    data = DINT[3].encode([1, -2, 3])
+    assert DINT[3].decode(data) == [1, -2, 3]
+    assert DINT[None].decode(data) == [1, -2, 3]
+    assert DINT[2].decode(data) == [1, -2]
+    with pytest.raises(BufferEmptyError):
+        DINT[4].decode(data)
+    with pytest.raises(DataError):
+        DINT[None].decode(data + b'\x00')
+
+
 # TODO: a whole lot of tests
 
@@ -1,4 +1,6 @@
-from pycomm3.util import strip_array, get_array_index
+from itertools import islice
+
+from pycomm3.util import strip_array, get_array_index, array_type_name, cycle
 
 TEST_TAG = "This is a tag"
 
@@ -21,3 +23,11 @@ def test_get_array_index_returns_index_value():
     TEST_ARRAY = "[123]"
     EXPECTED = (TEST_TAG, 123)
     assert EXPECTED == get_array_index(TEST_TAG + TEST_ARRAY)
+
+
+def test_array_type_name_includes_elements():
+    assert "DINT[10]" == array_type_name("DINT", 10)
+
+
+def test_cycle_restarts_after_stop():
+    assert [1, 2, 3, 1, 2, 3, 1] == list(islice(cycle(3, start=1), 7))